@@ -704,6 +704,7 @@ class HazelcastClient:
                 self._internal_lifecycle_service.fire_lifecycle_event(LifecycleState.SHUTTING_DOWN)
                 self._internal_lifecycle_service.shutdown()
                 self._proxy_session_manager.shutdown().result()
+                self._proxy_manager.shutdown()
                 self._near_cache_manager.destroy_near_caches()
                 self._connection_manager.shutdown()
                 self._invocation_service.shutdown()
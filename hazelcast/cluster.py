@@ -50,8 +50,8 @@ class ClientInfo:
 
 _EMPTY_SNAPSHOT = _MemberListSnapshot(-1, OrderedDict())
 _INITIAL_MEMBERS_TIMEOUT_SECONDS = 120
-_CLIENT_ENDPOINT_QUALIFIER = EndpointQualifier(ProtocolType.CLIENT, None)
-_MEMBER_ENDPOINT_QUALIFIER = EndpointQualifier(ProtocolType.MEMBER, None)
+_CLIENT_ENDPOINT_QUALIFIER = EndpointQualifier.get(ProtocolType.CLIENT, None)
+_MEMBER_ENDPOINT_QUALIFIER = EndpointQualifier.get(ProtocolType.MEMBER, None)
 
 
 class ClusterService:
@@ -288,7 +288,7 @@ class _InternalClusterService:
                 )
 
         if (len(new_members) + len(dead_members)) > 0:
-            if len(current_members) > 0:
+            if len(current_members) > 0 and _logger.isEnabledFor(logging.INFO):
                 _logger.info(self._members_string(current_members))
 
         return dead_members, new_members
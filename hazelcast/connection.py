@@ -49,7 +49,7 @@ _logger = logging.getLogger(__name__)
 
 _INF = float("inf")
 _SQL_CONNECTION_RANDOM_ATTEMPTS = 10
-_CLIENT_PUBLIC_ENDPOINT_QUALIFIER = EndpointQualifier(ProtocolType.CLIENT, "public")
+_CLIENT_PUBLIC_ENDPOINT_QUALIFIER = EndpointQualifier.get(ProtocolType.CLIENT, "public")
 
 
 class _WaitStrategy:
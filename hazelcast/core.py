@@ -1,10 +1,26 @@
 """Hazelcast Core objects and constants."""
+import functools
 import json
 import typing
 import uuid
 
 from hazelcast.types import KeyType, ValueType
 
+try:
+    import orjson
+
+    def _json_loads(s):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the json module; e.g. it rejects
+            # the NaN and Infinity that json.dumps emits by default.
+            return json.loads(s)
+
+
+except ImportError:
+    _json_loads = json.loads
+
 CLIENT_TYPE = "PYH"
 SERIALIZATION_VERSION = 1
 
@@ -15,7 +31,15 @@ class MemberInfo:
     status, attributes, version, and address map.
     """
 
-    __slots__ = ("address", "uuid", "attributes", "lite_member", "version", "address_map")
+    __slots__ = (
+        "address",
+        "uuid",
+        "attributes",
+        "lite_member",
+        "version",
+        "address_map",
+        "_hash",
+    )
 
     def __init__(
         self,
@@ -59,31 +83,50 @@ class MemberInfo:
         of this member.
         """
 
+        # The address might be replaced with the client endpoint
+        # address while creating the member list snapshot, so the
+        # hash is computed lazily.
+        self._hash = None
+
+    def __getstate__(self):
+        # The cached hash is left out, as hashes of strings
+        # differ between processes.
+        return {
+            "address": self.address,
+            "uuid": self.uuid,
+            "attributes": self.attributes,
+            "lite_member": self.lite_member,
+            "version": self.version,
+            "address_map": self.address_map,
+        }
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._hash = None
+
     def __str__(self):
-        return "Member [%s]:%s - %s%s" % (
-            self.address.host,
-            self.address.port,
-            self.uuid,
-            " lite" if self.lite_member else "",
-        )
+        address = self.address
+        lite = " lite" if self.lite_member else ""
+        return f"Member [{address.host}]:{address.port} - {self.uuid}{lite}"
 
     def __repr__(self):
-        return "Member(address=%s, uuid=%s, attributes=%s, lite_member=%s, version=%s)" % (
-            self.address,
-            self.uuid,
-            self.attributes,
-            self.lite_member,
-            self.version,
+        return (
+            f"Member(address={self.address}, uuid={self.uuid}, attributes={self.attributes}, "
+            f"lite_member={self.lite_member}, version={self.version})"
         )
 
     def __hash__(self):
-        return hash((self.address, self.uuid))
+        h = self._hash
+        if h is None:
+            h = self._hash = hash((self.address, self.uuid))
+        return h
 
     def __eq__(self, other):
-        return (
+        return self is other or (
             isinstance(other, MemberInfo)
-            and self.address == other.address
             and self.uuid == other.uuid
+            and self.address == other.address
         )
 
     def __ne__(self, other):
@@ -93,6 +136,8 @@ class MemberInfo:
 class Address:
     """Represents an address of a member in the cluster."""
 
+    __slots__ = ("host", "port", "_hash")
+
     def __init__(self, host: str, port: int):
         self.host = host
         """
@@ -104,14 +149,31 @@ class Address:
         Port of the address.
         """
 
+        self._hash = hash((host, port))
+
+    def __getstate__(self):
+        # Addresses might be pickled with the protocol 0, which
+        # requires explicit state handling for classes with slots.
+        return {"host": self.host, "port": self.port}
+
+    def __setstate__(self, state):
+        self.host = state["host"]
+        self.port = state["port"]
+        self._hash = hash((self.host, self.port))
+
     def __repr__(self):
-        return "Address(host=%s, port=%d)" % (self.host, self.port)
+        return f"Address(host={self.host}, port={self.port})"
 
     def __hash__(self):
-        return hash((self.host, self.port))
+        return self._hash
 
     def __eq__(self, other):
-        return isinstance(other, Address) and self.host == other.host and self.port == other.port
+        return self is other or (
+            isinstance(other, Address)
+            and self._hash == other._hash
+            and self.port == other.port
+            and self.host == other.host
+        )
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -160,11 +222,40 @@ class EndpointQualifier:
     configuration.
     """
 
-    __slots__ = ("_protocol_type", "_identifier")
+    __slots__ = ("_protocol_type", "_identifier", "_hash")
 
     def __init__(self, protocol_type: int, identifier: str):
         self._protocol_type = protocol_type
         self._identifier = identifier
+        self._hash = hash((protocol_type, identifier))
+
+    def __getstate__(self):
+        # The cached hash is left out, as hashes of strings
+        # differ between processes.
+        return {"protocol_type": self._protocol_type, "identifier": self._identifier}
+
+    def __setstate__(self, state):
+        self._protocol_type = state["protocol_type"]
+        self._identifier = state["identifier"]
+        self._hash = hash((self._protocol_type, self._identifier))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def get(protocol_type: int, identifier: typing.Optional[str]) -> "EndpointQualifier":
+        """Returns the shared endpoint qualifier instance for the given
+        protocol type and identifier.
+
+        Only a handful of distinct qualifiers exist in a deployment, so
+        instances are cached and reused.
+
+        Args:
+            protocol_type: Protocol type of the endpoint.
+            identifier: Unique identifier for same-protocol-type endpoints.
+
+        Returns:
+            The endpoint qualifier.
+        """
+        return EndpointQualifier(protocol_type, identifier)
 
     @property
     def protocol_type(self) -> int:
@@ -177,8 +268,9 @@ class EndpointQualifier:
         return self._identifier
 
     def __eq__(self, other):
-        return (
+        return self is other or (
             isinstance(other, EndpointQualifier)
+            and self._hash == other._hash
             and self._protocol_type == other._protocol_type
             and self._identifier == other._identifier
         )
@@ -187,31 +279,28 @@ class EndpointQualifier:
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash((self._protocol_type, self._identifier))
+        return self._hash
 
     def __repr__(self):
-        return "EndpointQualifier(protocol_type=%s, identifier=%s)" % (
-            self._protocol_type,
-            self._identifier,
+        return (
+            f"EndpointQualifier(protocol_type={self._protocol_type}, "
+            f"identifier={self._identifier})"
         )
 
 
 class AddressHelper:
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def get_possible_addresses(address):
+        # The same configured addresses are parsed on every
+        # connection attempt, and the result is immutable.
         address = AddressHelper.address_from_str(address)
-        possible_port = address.port
-        port_try_count = 1
-        if possible_port == -1:
-            port_try_count = 3
-            possible_port = 5701
-
-        addresses = []
-        for i in range(port_try_count):
-            addresses.append(Address(address.host, possible_port + i))
+        if address.port != -1:
+            # primary, secondary
+            return (address,), ()
 
-        # primary, secondary
-        return [addresses.pop(0)], addresses
+        host = address.host
+        return (Address(host, 5701),), (Address(host, 5702), Address(host, 5703))
 
     @staticmethod
     def address_from_str(address, port=-1):
@@ -237,20 +326,36 @@ class AddressHelper:
 
 
 class DistributedObjectInfo:
+    __slots__ = ("service_name", "name", "_hash")
+
     def __init__(self, service_name, name):
         self.service_name = service_name
         self.name = name
+        self._hash = hash((name, service_name))
+
+    def __getstate__(self):
+        # Explicit state handling is required for pickling
+        # classes with slots with the protocol 0.
+        return {"service_name": self.service_name, "name": self.name}
+
+    def __setstate__(self, state):
+        self.service_name = state["service_name"]
+        self.name = state["name"]
+        self._hash = hash((self.name, self.service_name))
 
     def __repr__(self):
-        return "DistributedObjectInfo(serviceName=%s, name=%s)" % (self.service_name, self.name)
+        return f"DistributedObjectInfo(serviceName={self.service_name}, name={self.name})"
 
     def __hash__(self):
-        return hash((self.name, self.service_name))
+        return self._hash
 
     def __eq__(self, other):
-        if isinstance(other, DistributedObjectInfo):
-            return self.name == other.name and self.service_name == other.service_name
-        return False
+        return self is other or (
+            isinstance(other, DistributedObjectInfo)
+            and self._hash == other._hash
+            and self.name == other.name
+            and self.service_name == other.service_name
+        )
 
 
 class DistributedObjectEventType:
@@ -270,6 +375,8 @@ class DistributedObjectEventType:
 class DistributedObjectEvent:
     """Distributed Object Event"""
 
+    __slots__ = ("name", "service_name", "event_type", "source")
+
     def __init__(self, name: str, service_name: str, event_type: str, source: uuid.UUID):
         self.name = name
         """
@@ -291,18 +398,40 @@ class DistributedObjectEvent:
         UUID of the member that fired the event.
         """
 
+    def __getstate__(self):
+        # Explicit state handling is required for pickling
+        # classes with slots with the protocol 0.
+        return {name: getattr(self, name) for name in DistributedObjectEvent.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __repr__(self):
-        return "DistributedObjectEvent(name=%s, service_name=%s, event_type=%s, source=%s)" % (
-            self.name,
-            self.service_name,
-            self.event_type,
-            self.source,
+        return (
+            f"DistributedObjectEvent(name={self.name}, service_name={self.service_name}, "
+            f"event_type={self.event_type}, source={self.source})"
         )
 
 
 class SimpleEntryView(typing.Generic[KeyType, ValueType]):
     """EntryView represents a readonly view of a map entry."""
 
+    __slots__ = (
+        "key",
+        "value",
+        "cost",
+        "creation_time",
+        "expiration_time",
+        "hits",
+        "last_access_time",
+        "last_stored_time",
+        "last_update_time",
+        "version",
+        "ttl",
+        "max_idle",
+    )
+
     def __init__(
         self,
         key: KeyType,
@@ -378,25 +507,22 @@ class SimpleEntryView(typing.Generic[KeyType, ValueType]):
         The last set max idle time in milliseconds.
         """
 
+    def __getstate__(self):
+        # Explicit state handling is required for pickling
+        # classes with slots with the protocol 0.
+        return {name: getattr(self, name) for name in SimpleEntryView.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __repr__(self):
         return (
-            "SimpleEntryView(key=%s, value=%s, cost=%s, creation_time=%s, "
-            "expiration_time=%s, hits=%s, last_access_time=%s, last_stored_time=%s, "
-            "last_update_time=%s, version=%s, ttl=%s, max_idle=%s"
-            % (
-                self.key,
-                self.value,
-                self.cost,
-                self.creation_time,
-                self.expiration_time,
-                self.hits,
-                self.last_access_time,
-                self.last_stored_time,
-                self.last_update_time,
-                self.version,
-                self.ttl,
-                self.max_idle,
-            )
+            f"SimpleEntryView(key={self.key}, value={self.value}, cost={self.cost}, "
+            f"creation_time={self.creation_time}, expiration_time={self.expiration_time}, "
+            f"hits={self.hits}, last_access_time={self.last_access_time}, "
+            f"last_stored_time={self.last_stored_time}, last_update_time={self.last_update_time}, "
+            f"version={self.version}, ttl={self.ttl}, max_idle={self.max_idle})"
         )
 
 
@@ -424,6 +550,8 @@ class HazelcastJsonValue:
     None values are not allowed.
     """
 
+    __slots__ = ("_json_string", "_hash")
+
     def __init__(self, value: typing.Any):
         if value is None:
             raise AssertionError("JSON string or the object cannot be None.")
@@ -431,6 +559,7 @@ class HazelcastJsonValue:
             self._json_string = value
         else:
             self._json_string = json.dumps(value)
+        self._hash = hash(self._json_string)
 
     def to_string(self) -> str:
         """Returns unaltered string that was used to create this object.
@@ -444,10 +573,22 @@ class HazelcastJsonValue:
         """Deserializes the string that was used to create this object
         and returns as Python object.
 
+        If the ``orjson`` package is installed, it is used to parse
+        the string. Otherwise, the ``json`` module is used.
+
         Returns:
             The Python object represented by the original string.
         """
-        return json.loads(self._json_string)
+        return _json_loads(self._json_string)
+
+    def __getstate__(self):
+        # Explicit state handling is required for pickling
+        # classes with slots with the protocol 0.
+        return {"json_string": self._json_string}
+
+    def __setstate__(self, state):
+        self._json_string = state["json_string"]
+        self._hash = hash(self._json_string)
 
     def __eq__(self, other):
         return isinstance(other, HazelcastJsonValue) and self._json_string == other._json_string
@@ -456,7 +597,7 @@ class HazelcastJsonValue:
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(self._json_string)
+        return self._hash
 
     def __repr__(self):
         return self._json_string
@@ -475,7 +616,7 @@ class MemberVersion:
         self.patch = patch
 
     def __repr__(self):
-        return "MemberVersion(major=%s, minor=%s, patch=%s)" % (self.major, self.minor, self.patch)
+        return f"MemberVersion(major={self.major}, minor={self.minor}, patch={self.patch})"
 
 
 class MapEntry(typing.Generic[KeyType, ValueType]):
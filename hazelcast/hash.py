@@ -1,4 +1,4 @@
-from hazelcast.serialization import LE_UINT
+import struct
 
 
 def murmur_hash3_x86_32(data):
@@ -19,10 +19,10 @@ def murmur_hash3_x86_32(data):
     c2 = 0x1B873593
 
     # body
-    for block_start in range(0, nblocks * 4, 4):
-        # ??? big endian?
-        k1 = LE_UINT.unpack_from(data, block_start + 8)[0]
-
+    # All the blocks are unpacked with a single call, instead of one
+    # unpack_from call per block.
+    blocks = struct.unpack_from("<%dI" % nblocks, data, 8) if nblocks else ()
+    for k1 in blocks:
         k1 = c1 * k1 & 0xFFFFFFFF
         k1 = (k1 << 15 | k1 >> 17) & 0xFFFFFFFF  # inlined ROTL32
         k1 = (c2 * k1) & 0xFFFFFFFF
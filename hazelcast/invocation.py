@@ -144,8 +144,7 @@ class InvocationService:
 
         correlation_id = self._next_correlation_id.get_and_increment()
         request = invocation.request
-        request.set_correlation_id(correlation_id)
-        request.set_partition_id(invocation.partition_id)
+        request.set_correlation_and_partition_id(correlation_id, invocation.partition_id)
         self._do_invoke(invocation)
 
     def shutdown(self):
@@ -17,6 +17,8 @@ def _random_key_func(_):
     return 0
 
 
+_MISSING = object()
+
 _eviction_key_func = {
     EvictionPolicy.NONE: None,
     EvictionPolicy.LRU: _lru_key_func,
@@ -151,14 +153,33 @@ class NearCache(dict):
         super(NearCache, self).__setitem__(key, data_record)
 
     def __getitem__(self, key):
-        try:
-            value_record = super(NearCache, self).__getitem__(key)
-            if value_record.is_expired(self.max_idle):
-                super(NearCache, self).__delitem__(key)
-                raise KeyError
-        except KeyError as ke:
+        value = self._get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def _get_many(self, keys, default):
+        """Looks up the given keys in order.
+
+        Returns:
+            list: The cached values, with ``default`` in place of the keys
+            that are not found or expired.
+        """
+        get = self._get
+        return [get(key, default) for key in keys]
+
+    def _get(self, key, default):
+        # Records are never None, so dict.get avoids raising
+        # and catching KeyError on every miss
+        value_record = dict.get(self, key)
+        if value_record is None:
+            self._misses += 1
+            return default
+
+        if value_record.is_expired(self.max_idle):
+            super(NearCache, self).__delitem__(key)
             self._misses += 1
-            raise ke
+            return default
 
         if self.eviction_policy == EvictionPolicy.LRU:
             value_record.last_access_time = current_time()
@@ -255,6 +276,17 @@ class NearCache(dict):
             pass
         self._invalidation_requests += 1
 
+    def _invalidate_many(self, key_data_list):
+        pop = self.pop
+        invalidations = 0
+        for key_data in key_data_list:
+            # Records are never None, so a None result means there
+            # was nothing to invalidate for that key
+            if pop(key_data, None) is not None:
+                invalidations += 1
+        self._invalidations += invalidations
+        self._invalidation_requests += len(key_data_list)
+
     def __repr__(self):
         return "NearCache(len=%s, evicted=%s)" % (self.__len__(), self._evictions)
 
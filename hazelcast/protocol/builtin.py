@@ -1,3 +1,4 @@
+import struct
 import uuid
 from datetime import date, time, datetime, timedelta, timezone
 from decimal import Decimal
@@ -18,7 +19,6 @@ from hazelcast.serialization.bits import (
     LE_LONG,
     BOOLEAN_SIZE_IN_BYTES,
     INT_SIZE_IN_BYTES,
-    LE_ULONG,
     LE_UINT16,
     LE_INT8,
     UUID_MSB_SHIFT,
@@ -39,6 +39,15 @@ _LOCAL_TIME_SIZE_IN_BYTES = BYTE_SIZE_IN_BYTES * 3 + INT_SIZE_IN_BYTES
 _LOCAL_DATE_TIME_SIZE_IN_BYTES = _LOCAL_DATE_SIZE_IN_BYTES + _LOCAL_TIME_SIZE_IN_BYTES
 _OFFSET_DATE_TIME_SIZE_IN_BYTES = _LOCAL_DATE_TIME_SIZE_IN_BYTES + INT_SIZE_IN_BYTES
 
+# Frame length and flags
+_LE_FRAME_HEADER = struct.Struct("<iH")
+
+# Most and least significant bits of a UUID, as two little-endian longs
+_LE_UUID_BITS = struct.Struct("<QQ")
+
+# Null flag, followed by the bits of the UUID
+_LE_NULLABLE_UUID = struct.Struct("<?QQ")
+
 
 class CodecUtil:
     @staticmethod
@@ -85,11 +94,12 @@ class CodecUtil:
 class ByteArrayCodec:
     @staticmethod
     def encode(buf, value, is_final=False):
-        header = bytearray(SIZE_OF_FRAME_LENGTH_AND_FLAGS)
-        LE_INT.pack_into(header, 0, SIZE_OF_FRAME_LENGTH_AND_FLAGS + len(value))
-        if is_final:
-            LE_UINT16.pack_into(header, INT_SIZE_IN_BYTES, _IS_FINAL_FLAG)
-        buf.extend(header)
+        buf.extend(
+            _LE_FRAME_HEADER.pack(
+                SIZE_OF_FRAME_LENGTH_AND_FLAGS + len(value),
+                _IS_FINAL_FLAG if is_final else 0,
+            )
+        )
         buf.extend(value)
 
     @staticmethod
@@ -101,11 +111,12 @@ class DataCodec:
     @staticmethod
     def encode(buf, value, is_final=False):
         value_bytes = value.to_bytes()
-        header = bytearray(SIZE_OF_FRAME_LENGTH_AND_FLAGS)
-        LE_INT.pack_into(header, 0, SIZE_OF_FRAME_LENGTH_AND_FLAGS + len(value_bytes))
-        if is_final:
-            LE_UINT16.pack_into(header, INT_SIZE_IN_BYTES, _IS_FINAL_FLAG)
-        buf.extend(header)
+        buf.extend(
+            _LE_FRAME_HEADER.pack(
+                SIZE_OF_FRAME_LENGTH_AND_FLAGS + len(value_bytes),
+                _IS_FINAL_FLAG if is_final else 0,
+            )
+        )
         buf.extend(value_bytes)
 
     @staticmethod
@@ -174,6 +185,9 @@ class EntryListCodec:
 
 _UUID_LONG_ENTRY_SIZE_IN_BYTES = UUID_SIZE_IN_BYTES + LONG_SIZE_IN_BYTES
 
+# Null flag and bits of the UUID key, followed by the long value
+_LE_UUID_LONG_ENTRY = struct.Struct("<?QQq")
+
 
 class EntryListUUIDLongCodec:
     @staticmethod
@@ -184,11 +198,16 @@ class EntryListUUIDLongCodec:
         LE_INT.pack_into(b, 0, size)
         if is_final:
             LE_UINT16.pack_into(b, INT_SIZE_IN_BYTES, _IS_FINAL_FLAG)
-        for i in range(n):
-            key, value = entries[i]
-            o = SIZE_OF_FRAME_LENGTH_AND_FLAGS + i * _UUID_LONG_ENTRY_SIZE_IN_BYTES
-            FixSizedTypesCodec.encode_uuid(b, o, key)
-            FixSizedTypesCodec.encode_long(b, o + UUID_SIZE_IN_BYTES, value)
+        o = SIZE_OF_FRAME_LENGTH_AND_FLAGS
+        for key, value in entries:
+            if key is None:
+                _LE_UUID_LONG_ENTRY.pack_into(b, o, True, 0, 0, value)
+            else:
+                i = key.int
+                _LE_UUID_LONG_ENTRY.pack_into(
+                    b, o, False, i >> UUID_MSB_SHIFT, i & UUID_LSB_MASK, value
+                )
+            o += _UUID_LONG_ENTRY_SIZE_IN_BYTES
         buf.extend(b)
 
     @staticmethod
@@ -196,10 +215,9 @@ class EntryListUUIDLongCodec:
         b = msg.next_frame().buf
         n = len(b) // _UUID_LONG_ENTRY_SIZE_IN_BYTES
         result = []
-        for i in range(n):
-            o = i * _UUID_LONG_ENTRY_SIZE_IN_BYTES
-            key = FixSizedTypesCodec.decode_uuid(b, o)
-            value = FixSizedTypesCodec.decode_long(b, o + UUID_SIZE_IN_BYTES)
+        entries = memoryview(b)[: n * _UUID_LONG_ENTRY_SIZE_IN_BYTES]
+        for is_null, msb, lsb, value in _LE_UUID_LONG_ENTRY.iter_unpack(entries):
+            key = None if is_null else uuid.UUID(int=(msb << UUID_MSB_SHIFT) | lsb)
             result.append((key, value))
         return result
 
@@ -269,9 +287,10 @@ class FixSizedTypesCodec:
         if is_null:
             return
 
-        o = offset + BOOLEAN_SIZE_IN_BYTES
-        LE_ULONG.pack_into(buf, o, value.int >> UUID_MSB_SHIFT)
-        LE_ULONG.pack_into(buf, o + LONG_SIZE_IN_BYTES, value.int & UUID_LSB_MASK)
+        i = value.int
+        _LE_UUID_BITS.pack_into(
+            buf, offset + BOOLEAN_SIZE_IN_BYTES, i >> UUID_MSB_SHIFT, i & UUID_LSB_MASK
+        )
 
     @staticmethod
     def decode_uuid(buf, offset):
@@ -279,13 +298,8 @@ class FixSizedTypesCodec:
         if is_null:
             return None
 
-        msb_offset = offset + BOOLEAN_SIZE_IN_BYTES
-        lsb_offset = msb_offset + LONG_SIZE_IN_BYTES
-        b = (
-            buf[lsb_offset - 1 : msb_offset - 1 : -1]
-            + buf[lsb_offset + LONG_SIZE_IN_BYTES - 1 : lsb_offset - 1 : -1]
-        )
-        return uuid.UUID(bytes=bytes(b))
+        msb, lsb = _LE_UUID_BITS.unpack_from(buf, offset + BOOLEAN_SIZE_IN_BYTES)
+        return uuid.UUID(int=(msb << UUID_MSB_SHIFT) | lsb)
 
     @staticmethod
     def decode_short(buf, offset):
@@ -340,20 +354,15 @@ class ListIntegerCodec:
         LE_INT.pack_into(b, 0, size)
         if is_final:
             LE_UINT16.pack_into(b, INT_SIZE_IN_BYTES, _IS_FINAL_FLAG)
-        for i in range(n):
-            FixSizedTypesCodec.encode_int(
-                b, SIZE_OF_FRAME_LENGTH_AND_FLAGS + i * INT_SIZE_IN_BYTES, arr[i]
-            )
+        if n > 0:
+            struct.pack_into("<%di" % n, b, SIZE_OF_FRAME_LENGTH_AND_FLAGS, *arr)
         buf.extend(b)
 
     @staticmethod
     def decode(msg):
         b = msg.next_frame().buf
         n = len(b) // INT_SIZE_IN_BYTES
-        result = []
-        for i in range(n):
-            result.append(FixSizedTypesCodec.decode_int(b, i * INT_SIZE_IN_BYTES))
-        return result
+        return list(struct.unpack_from("<%di" % n, b, 0))
 
 
 class ListLongCodec:
@@ -365,20 +374,15 @@ class ListLongCodec:
         LE_INT.pack_into(b, 0, size)
         if is_final:
             LE_UINT16.pack_into(b, INT_SIZE_IN_BYTES, _IS_FINAL_FLAG)
-        for i in range(n):
-            FixSizedTypesCodec.encode_long(
-                b, SIZE_OF_FRAME_LENGTH_AND_FLAGS + i * LONG_SIZE_IN_BYTES, arr[i]
-            )
+        if n > 0:
+            struct.pack_into("<%dq" % n, b, SIZE_OF_FRAME_LENGTH_AND_FLAGS, *arr)
         buf.extend(b)
 
     @staticmethod
     def decode(msg):
         b = msg.next_frame().buf
         n = len(b) // LONG_SIZE_IN_BYTES
-        result = []
-        for i in range(n):
-            result.append(FixSizedTypesCodec.decode_long(b, i * LONG_SIZE_IN_BYTES))
-        return result
+        return list(struct.unpack_from("<%dq" % n, b, 0))
 
 
 class ListMultiFrameCodec:
@@ -455,20 +459,26 @@ class ListUUIDCodec:
         LE_INT.pack_into(b, 0, size)
         if is_final:
             LE_UINT16.pack_into(b, INT_SIZE_IN_BYTES, _IS_FINAL_FLAG)
-        for i in range(n):
-            FixSizedTypesCodec.encode_uuid(
-                b, SIZE_OF_FRAME_LENGTH_AND_FLAGS + i * UUID_SIZE_IN_BYTES, arr[i]
-            )
+        o = SIZE_OF_FRAME_LENGTH_AND_FLAGS
+        for item in arr:
+            if item is None:
+                _LE_NULLABLE_UUID.pack_into(b, o, True, 0, 0)
+            else:
+                i = item.int
+                _LE_NULLABLE_UUID.pack_into(b, o, False, i >> UUID_MSB_SHIFT, i & UUID_LSB_MASK)
+            o += UUID_SIZE_IN_BYTES
         buf.extend(b)
 
     @staticmethod
     def decode(msg):
         b = msg.next_frame().buf
         n = len(b) // UUID_SIZE_IN_BYTES
-        result = []
-        for i in range(n):
-            result.append(FixSizedTypesCodec.decode_uuid(b, i * UUID_SIZE_IN_BYTES))
-        return result
+        return [
+            None if is_null else uuid.UUID(int=(msb << UUID_MSB_SHIFT) | lsb)
+            for is_null, msb, lsb in _LE_NULLABLE_UUID.iter_unpack(
+                memoryview(b)[: n * UUID_SIZE_IN_BYTES]
+            )
+        ]
 
 
 class LongArrayCodec:
@@ -480,20 +490,15 @@ class LongArrayCodec:
         LE_INT.pack_into(b, 0, size)
         if is_final:
             LE_UINT16.pack_into(b, INT_SIZE_IN_BYTES, _IS_FINAL_FLAG)
-        for i in range(n):
-            FixSizedTypesCodec.encode_long(
-                b, SIZE_OF_FRAME_LENGTH_AND_FLAGS + i * LONG_SIZE_IN_BYTES, arr[i]
-            )
+        if n > 0:
+            struct.pack_into("<%dq" % n, b, SIZE_OF_FRAME_LENGTH_AND_FLAGS, *arr)
         buf.extend(b)
 
     @staticmethod
     def decode(msg):
         b = msg.next_frame().buf
         n = len(b) // LONG_SIZE_IN_BYTES
-        result = []
-        for i in range(n):
-            result.append(FixSizedTypesCodec.decode_long(b, i * LONG_SIZE_IN_BYTES))
-        return result
+        return list(struct.unpack_from("<%dq" % n, b, 0))
 
 
 class MapCodec:
@@ -542,11 +547,12 @@ class StringCodec:
     @staticmethod
     def encode(buf, value, is_final=False):
         value_bytes = value.encode("utf-8")
-        header = bytearray(SIZE_OF_FRAME_LENGTH_AND_FLAGS)
-        LE_INT.pack_into(header, 0, SIZE_OF_FRAME_LENGTH_AND_FLAGS + len(value_bytes))
-        if is_final:
-            LE_UINT16.pack_into(header, INT_SIZE_IN_BYTES, _IS_FINAL_FLAG)
-        buf.extend(header)
+        buf.extend(
+            _LE_FRAME_HEADER.pack(
+                SIZE_OF_FRAME_LENGTH_AND_FLAGS + len(value_bytes),
+                _IS_FINAL_FLAG if is_final else 0,
+            )
+        )
         buf.extend(value_bytes)
 
     @staticmethod
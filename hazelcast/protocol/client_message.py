@@ -1,5 +1,6 @@
 import errno
 import socket
+import struct
 
 from hazelcast.serialization.bits import *
 
@@ -15,6 +16,9 @@ _OUTBOUND_MESSAGE_MESSAGE_TYPE_OFFSET = _MESSAGE_TYPE_OFFSET + SIZE_OF_FRAME_LEN
 _OUTBOUND_MESSAGE_CORRELATION_ID_OFFSET = _CORRELATION_ID_OFFSET + SIZE_OF_FRAME_LENGTH_AND_FLAGS
 _OUTBOUND_MESSAGE_PARTITION_ID_OFFSET = _PARTITION_ID_OFFSET + SIZE_OF_FRAME_LENGTH_AND_FLAGS
 
+# The partition id directly follows the correlation id in the header
+_LE_CORRELATION_AND_PARTITION_ID = struct.Struct("<qi")
+
 REQUEST_HEADER_SIZE = _OUTBOUND_MESSAGE_PARTITION_ID_OFFSET + INT_SIZE_IN_BYTES
 RESPONSE_HEADER_SIZE = _RESPONSE_BACKUP_ACKS_OFFSET + BYTE_SIZE_IN_BYTES
 EVENT_HEADER_SIZE = _PARTITION_ID_OFFSET + INT_SIZE_IN_BYTES
@@ -79,6 +83,11 @@ class OutboundMessage:
     def set_partition_id(self, partition_id):
         LE_INT.pack_into(self.buf, _OUTBOUND_MESSAGE_PARTITION_ID_OFFSET, partition_id)
 
+    def set_correlation_and_partition_id(self, correlation_id, partition_id):
+        _LE_CORRELATION_AND_PARTITION_ID.pack_into(
+            self.buf, _OUTBOUND_MESSAGE_CORRELATION_ID_OFFSET, correlation_id, partition_id
+        )
+
     def copy(self):
         return OutboundMessage(bytearray(self.buf), self.retryable)
 
@@ -151,8 +160,8 @@ class InboundMessage:
 
     def next_frame(self):
         result = self._next_frame
-        if self._next_frame is not None:
-            self._next_frame = self._next_frame.next
+        if result is not None:
+            self._next_frame = result.next
         return result
 
     def has_next_frame(self):
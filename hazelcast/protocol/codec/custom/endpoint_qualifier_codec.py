@@ -28,4 +28,4 @@ class EndpointQualifierCodec:
         type = FixSizedTypesCodec.decode_int(initial_frame.buf, _TYPE_DECODE_OFFSET)
         identifier = CodecUtil.decode_nullable(msg, StringCodec.decode)
         CodecUtil.fast_forward_to_end_frame(msg)
-        return EndpointQualifier(type, identifier)
+        return EndpointQualifier.get(type, identifier)
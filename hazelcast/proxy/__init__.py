@@ -83,3 +83,7 @@ class ProxyManager:
 
     def get_distributed_objects(self):
         return to_list(self._proxies.values())
+
+    def shutdown(self):
+        for proxy in to_list(self._proxies.values()):
+            proxy._on_shutdown()
@@ -45,6 +45,9 @@ class Proxy(typing.Generic[BlockingProxyType], abc.ABC):
     def _on_destroy(self):
         pass
 
+    def _on_shutdown(self):
+        pass
+
     def __repr__(self) -> str:
         return '%s(name="%s")' % (type(self).__name__, self.name)
 
@@ -216,6 +219,17 @@ class EntryEvent(typing.Generic[KeyType, ValueType]):
         number_of_affected_entries: Number of affected entries by this event.
     """
 
+    __slots__ = (
+        "_to_object",
+        "_key_data",
+        "_value_data",
+        "_old_value_data",
+        "_merging_value_data",
+        "event_type",
+        "uuid",
+        "number_of_affected_entries",
+    )
+
     def __init__(
         self,
         to_object,
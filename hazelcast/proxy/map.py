@@ -1,13 +1,19 @@
-import itertools
+import collections
+import functools
+import threading
+import time
 import typing
 
 from hazelcast.aggregator import Aggregator
 from hazelcast.config import IndexUtil, IndexType, IndexConfig
 from hazelcast.core import SimpleEntryView
-from hazelcast.future import combine_futures, ImmediateFuture, Future
+from hazelcast.errors import HazelcastClientNotActiveError
+from hazelcast.future import combine_futures, ImmediateFuture, ImmediateExceptionFuture, Future
 from hazelcast.invocation import Invocation
 from hazelcast.projection import Projection
 from hazelcast.protocol import PagingPredicateHolder
+from hazelcast.protocol.builtin import DataCodec
+from hazelcast.protocol.client_message import OutboundMessage, SIZE_OF_FRAME_LENGTH_AND_FLAGS
 from hazelcast.protocol.codec import (
     map_add_entry_listener_codec,
     map_add_entry_listener_to_key_codec,
@@ -79,9 +85,13 @@ from hazelcast.proxy.base import (
     MAX_SIZE,
 )
 from hazelcast.predicate import PagingPredicate, Predicate
+from hazelcast.serialization.bits import LE_LONG
+from hazelcast.serialization.data import Data
 from hazelcast.types import AggregatorResultType, KeyType, ValueType, ProjectionType
 from hazelcast.util import (
     check_not_none,
+    check_not_negative,
+    check_true,
     thread_id,
     to_millis,
     ImmutableLazyDataList,
@@ -91,6 +101,30 @@ from hazelcast.util import (
 
 EntryEventCallable = typing.Callable[[EntryEvent[KeyType, ValueType]], None]
 
+_KEY_DATA_CACHE_SIZE = 1024
+
+_KEY_DATA_CACHE_MAX_STR_LENGTH = 256
+
+_EMPTY_DATA = Data(bytearray())
+
+# Distinct parameters to check the request templates with
+_SAMPLE_KEY_DATA = Data(bytearray(b"sample-key"))
+_SAMPLE_VALUE_DATA = Data(bytearray(b"sample-value"))
+
+# Marks the keys not found in the near cache, as None might be cached
+_NEAR_CACHE_MISS = object()
+
+_KEY_NONE_MSG = "key can't be None"
+_VALUE_NONE_MSG = "value can't be None"
+
+# Indexed by (has_key << 1) | has_predicate.
+_ENTRY_LISTENER_CODECS = (
+    map_add_entry_listener_codec,
+    map_add_entry_listener_with_predicate_codec,
+    map_add_entry_listener_to_key_codec,
+    map_add_entry_listener_to_key_with_predicate_codec,
+)
+
 
 class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
     """Hazelcast Map client proxy to access the map on the cluster.
@@ -127,6 +161,55 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
     def __init__(self, service_name, name, context):
         super(Map, self).__init__(service_name, name, context)
         self._reference_id_generator = context.lock_reference_id_generator
+        # Wraps the method of the serialization service, not of the
+        # proxy, so that the cache does not reference the proxy.
+        self._cached_key_to_data = functools.lru_cache(maxsize=_KEY_DATA_CACHE_SIZE)(
+            context.serialization_service.to_data
+        )
+
+        # The name of the proxy never changes, so the requests of the
+        # frequently used operations are encoded once with empty
+        # parameters. The resulting templates, which end with the name frame,
+        # are copied and completed with the actual parameters on each call.
+        self._encode_get_request = _KeyRequestEncoder(map_get_codec, name)
+        self._encode_put_request = _EntryRequestEncoder(map_put_codec, name)
+        self._encode_set_request = _EntryRequestEncoder(map_set_codec, name)
+        self._encode_remove_request = _KeyRequestEncoder(map_remove_codec, name)
+        self._encode_delete_request = _KeyRequestEncoder(map_delete_codec, name)
+        self._encode_contains_key_request = _KeyRequestEncoder(map_contains_key_codec, name)
+        self._encode_contains_value_request = _ValueRequestEncoder(map_contains_value_codec, name)
+        self._encode_is_empty_request = _NameRequestEncoder(map_is_empty_codec, name)
+        self._encode_size_request = _NameRequestEncoder(map_size_codec, name)
+
+        # Response handlers of the frequently used operations, created
+        # once instead of on each call.
+        to_object = self._to_object
+        self._get_response_handler = functools.partial(
+            _object_response_handler, map_get_codec, to_object
+        )
+        self._put_response_handler = functools.partial(
+            _object_response_handler, map_put_codec, to_object
+        )
+        self._put_if_absent_response_handler = functools.partial(
+            _object_response_handler, map_put_if_absent_codec, to_object
+        )
+        self._remove_response_handler = functools.partial(
+            _object_response_handler, map_remove_codec, to_object
+        )
+        self._replace_response_handler = functools.partial(
+            _object_response_handler, map_replace_codec, to_object
+        )
+        self._execute_on_key_response_handler = functools.partial(
+            _object_response_handler, map_execute_on_key_codec, to_object
+        )
+        self._execute_on_keys_response_handler = functools.partial(
+            _data_list_response_handler, map_execute_on_keys_codec, ImmutableLazyDataList, to_object
+        )
+        self._get_entry_view_response_handler = functools.partial(
+            _entry_view_response_handler, to_object
+        )
+
+        self._put_coalescer = _PutCoalescer(self, context.reactor)
 
     def add_entry_listener(
         self,
@@ -185,61 +268,76 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             LOADED=loaded_func,
         )
 
-        if key and predicate:
-            codec = map_add_entry_listener_to_key_with_predicate_codec
-            key_data = self._to_data(key)
-            predicate_data = self._to_data(predicate)
-            request = codec.encode_request(
-                self.name, key_data, predicate_data, include_value, flags, self._is_smart
-            )
-        elif key and not predicate:
-            codec = map_add_entry_listener_to_key_codec
-            key_data = self._to_data(key)
-            request = codec.encode_request(
-                self.name, key_data, include_value, flags, self._is_smart
-            )
-        elif not key and predicate:
-            codec = map_add_entry_listener_with_predicate_codec
-            predicate = self._to_data(predicate)
-            request = codec.encode_request(
-                self.name, predicate, include_value, flags, self._is_smart
-            )
+        has_key = bool(key)
+        has_predicate = bool(predicate)
+        codec = _ENTRY_LISTENER_CODECS[(has_key << 1) | has_predicate]
+        filter_args = []
+        if has_key:
+            filter_args.append(self._to_data(key))
+        if has_predicate:
+            filter_args.append(self._to_data(predicate))
+        request = codec.encode_request(
+            self.name, *filter_args, include_value, flags, self._is_smart
+        )
+
+        callbacks = {
+            EntryEventType.ADDED: added_func,
+            EntryEventType.REMOVED: removed_func,
+            EntryEventType.UPDATED: updated_func,
+            EntryEventType.EVICTED: evicted_func,
+            EntryEventType.EVICT_ALL: evict_all_func,
+            EntryEventType.CLEAR_ALL: clear_all_func,
+            EntryEventType.MERGED: merged_func,
+            EntryEventType.EXPIRED: expired_func,
+            EntryEventType.LOADED: loaded_func,
+        }
+        callbacks = {event_type: func for event_type, func in callbacks.items() if func}
+        to_object = self._to_object
+
+        if len(callbacks) == 1:
+            # Most listeners are interested in a single event type, so
+            # dispatch to its callback without the dictionary lookup.
+            ((listened_event_type, single_callback),) = callbacks.items()
+
+            def handle_event_entry(
+                key_, value, old_value, merging_value, event_type, uuid, number_of_affected_entries
+            ):
+                if event_type != listened_event_type:
+                    return
+
+                single_callback(
+                    EntryEvent(
+                        to_object,
+                        key_,
+                        value,
+                        old_value,
+                        merging_value,
+                        event_type,
+                        uuid,
+                        number_of_affected_entries,
+                    )
+                )
+
         else:
-            codec = map_add_entry_listener_codec
-            request = codec.encode_request(self.name, include_value, flags, self._is_smart)
-
-        def handle_event_entry(
-            key_, value, old_value, merging_value, event_type, uuid, number_of_affected_entries
-        ):
-            event = EntryEvent(
-                self._to_object,
-                key_,
-                value,
-                old_value,
-                merging_value,
-                event_type,
-                uuid,
-                number_of_affected_entries,
-            )
 
-            if event.event_type == EntryEventType.ADDED:
-                added_func(event)
-            elif event.event_type == EntryEventType.REMOVED:
-                removed_func(event)
-            elif event.event_type == EntryEventType.UPDATED:
-                updated_func(event)
-            elif event.event_type == EntryEventType.EVICTED:
-                evicted_func(event)
-            elif event.event_type == EntryEventType.EVICT_ALL:
-                evict_all_func(event)
-            elif event.event_type == EntryEventType.CLEAR_ALL:
-                clear_all_func(event)
-            elif event.event_type == EntryEventType.MERGED:
-                merged_func(event)
-            elif event.event_type == EntryEventType.EXPIRED:
-                expired_func(event)
-            elif event.event_type == EntryEventType.LOADED:
-                loaded_func(event)
+            def handle_event_entry(
+                key_, value, old_value, merging_value, event_type, uuid, number_of_affected_entries
+            ):
+                callback = callbacks.get(event_type, None)
+                if callback is None:
+                    return
+
+                event = EntryEvent(
+                    to_object,
+                    key_,
+                    value,
+                    old_value,
+                    merging_value,
+                    event_type,
+                    uuid,
+                    number_of_affected_entries,
+                )
+                callback(event)
 
         return self._register_listener(
             request,
@@ -305,14 +403,10 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
                   :class:`hazelcast.config.UniqueKeyTransformation` for
                   possible values.
         """
-        d = {
-            "name": name,
-            "type": index_type,
-            "attributes": attributes,
-            "bitmap_index_options": bitmap_index_options,
-        }
-        config = IndexConfig.from_dict(d)
-        validated = IndexUtil.validate_and_normalize(self.name, config)
+        validated = _validate_index_config(
+            self.name, attributes, index_type, name, bitmap_index_options
+        )
+
         request = map_add_index_codec.encode_request(self.name, validated)
         return self._invoke(request)
 
@@ -354,19 +448,14 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             if isinstance(predicate, PagingPredicate):
                 raise AssertionError("Paging predicate is not supported.")
 
-            def handler(message):
-                return self._to_object(map_aggregate_with_predicate_codec.decode_response(message))
-
+            codec = map_aggregate_with_predicate_codec
             predicate_data = self._to_data(predicate)
-            request = map_aggregate_with_predicate_codec.encode_request(
-                self.name, aggregator_data, predicate_data
-            )
-            return self._invoke(request, handler)
-
-        def handler(message):
-            return self._to_object(map_aggregate_codec.decode_response(message))
+            request = codec.encode_request(self.name, aggregator_data, predicate_data)
+        else:
+            codec = map_aggregate_codec
+            request = codec.encode_request(self.name, aggregator_data)
 
-        request = map_aggregate_codec.encode_request(self.name, aggregator_data)
+        handler = functools.partial(_object_response_handler, codec, self._to_object)
         return self._invoke(request, handler)
 
     def clear(self) -> Future[None]:
@@ -393,7 +482,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             ``False`` otherwise.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         return self._contains_key_internal(key_data)
 
     def contains_value(self, value: ValueType) -> Future[bool]:
@@ -410,7 +499,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         check_not_none(value, "value can't be None")
         value_data = self._to_data(value)
 
-        request = map_contains_value_codec.encode_request(self.name, value_data)
+        request = self._encode_contains_value_request(value_data)
         return self._invoke(request, map_contains_value_codec.decode_response)
 
     def delete(self, key: KeyType) -> Future[None]:
@@ -436,11 +525,11 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             key: Key of the mapping to be deleted.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         return self._delete_internal(key_data)
 
     def entry_set(
-        self, predicate: Predicate = None
+        self, predicate: Predicate = None, eager: bool = False
     ) -> Future[typing.List[typing.Tuple[KeyType, ValueType]]]:
         """Returns a list clone of the mappings contained in this map.
 
@@ -450,38 +539,40 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
 
         Args:
             predicate: Predicate for the map to filter entries.
+            eager: Whether to deserialize all the entries when the response
+                is received. By default, they are deserialized lazily, on
+                first access. Eager deserialization is cheaper when the
+                whole list is going to be iterated anyway.
 
         Returns:
             The list of key-value tuples in the map.
         """
+        list_factory = _deserialize_entry_list if eager else ImmutableLazyDataList
         if predicate:
             if isinstance(predicate, PagingPredicate):
                 codec = map_entries_with_paging_predicate_codec
-
-                def handler(message):
-                    response = codec.decode_response(message)
-                    predicate.anchor_list = response["anchor_data_list"].as_anchor_list(
-                        self._to_object
-                    )
-                    return ImmutableLazyDataList(response["response"], self._to_object)
-
+                handler = functools.partial(
+                    _paging_predicate_response_handler,
+                    codec,
+                    predicate,
+                    list_factory,
+                    self._to_object,
+                )
                 predicate.iteration_type = IterationType.ENTRY
                 holder = PagingPredicateHolder.of(predicate, self._to_data)
                 request = codec.encode_request(self.name, holder)
             else:
                 codec = map_entries_with_predicate_codec
-
-                def handler(message):
-                    return ImmutableLazyDataList(codec.decode_response(message), self._to_object)
-
+                handler = functools.partial(
+                    _data_list_response_handler, codec, list_factory, self._to_object
+                )
                 predicate_data = self._to_data(predicate)
                 request = codec.encode_request(self.name, predicate_data)
         else:
             codec = map_entry_set_codec
-
-            def handler(message):
-                return ImmutableLazyDataList(codec.decode_response(message), self._to_object)
-
+            handler = functools.partial(
+                _data_list_response_handler, codec, list_factory, self._to_object
+            )
             request = codec.encode_request(self.name)
 
         return self._invoke(request, handler)
@@ -501,7 +592,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             ``True`` if the key is evicted, ``False`` otherwise.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         return self._evict_internal(key_data)
 
     def evict_all(self) -> Future[None]:
@@ -532,27 +623,18 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             entry process.
         """
         if predicate:
-
-            def handler(message):
-                return ImmutableLazyDataList(
-                    map_execute_with_predicate_codec.decode_response(message), self._to_object
-                )
-
+            codec = map_execute_with_predicate_codec
             entry_processor_data = self._to_data(entry_processor)
             predicate_data = self._to_data(predicate)
-            request = map_execute_with_predicate_codec.encode_request(
-                self.name, entry_processor_data, predicate_data
-            )
+            request = codec.encode_request(self.name, entry_processor_data, predicate_data)
         else:
-
-            def handler(message):
-                return ImmutableLazyDataList(
-                    map_execute_on_all_keys_codec.decode_response(message), self._to_object
-                )
-
+            codec = map_execute_on_all_keys_codec
             entry_processor_data = self._to_data(entry_processor)
-            request = map_execute_on_all_keys_codec.encode_request(self.name, entry_processor_data)
+            request = codec.encode_request(self.name, entry_processor_data)
 
+        handler = functools.partial(
+            _data_list_response_handler, codec, ImmutableLazyDataList, self._to_object
+        )
         return self._invoke(request, handler)
 
     def execute_on_key(self, key: KeyType, entry_processor: typing.Any) -> Future[typing.Any]:
@@ -572,7 +654,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             Result of entry process.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         return self._execute_on_key_internal(key_data, entry_processor)
 
     def execute_on_keys(
@@ -594,24 +676,22 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             List of map entries which includes the keys and the results of the
             entry process.
         """
-        key_list = []
-        for key in keys:
-            check_not_none(key, "key can't be None")
-            key_list.append(self._to_data(key))
-
-        if len(keys) == 0:
+        if not keys:
             return ImmediateFuture([])
 
-        def handler(message):
-            return ImmutableLazyDataList(
-                map_execute_on_keys_codec.decode_response(message), self._to_object
-            )
+        to_data = self._to_data
+        key_list = []
+        append = key_list.append
+        for key in keys:
+            if key is None:
+                raise AssertionError(_KEY_NONE_MSG)
+            append(to_data(key))
 
         entry_processor_data = self._to_data(entry_processor)
         request = map_execute_on_keys_codec.encode_request(
             self.name, entry_processor_data, key_list
         )
-        return self._invoke(request, handler)
+        return self._invoke(request, self._execute_on_keys_response_handler)
 
     def flush(self) -> Future[None]:
         """Flushes all the local dirty entries."""
@@ -634,7 +714,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             key: The key to lock.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
 
         request = map_force_unlock_codec.encode_request(
             self.name, key_data, self._reference_id_generator.get_and_increment()
@@ -666,7 +746,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             The value for the specified key.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         return self._get_internal(key_data)
 
     def get_all(self, keys: typing.Sequence[KeyType]) -> Future[typing.Dict[KeyType, ValueType]]:
@@ -692,17 +772,15 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         if not keys:
             return ImmediateFuture({})
 
-        partition_service = self._context.partition_service
-        partition_to_keys = {}
+        to_data = self._to_data
+        get_partition_id = self._partition_service.get_partition_id
+        partition_to_keys = collections.defaultdict(dict)
 
         for key in keys:
-            check_not_none(key, "key can't be None")
-            key_data = self._to_data(key)
-            partition_id = partition_service.get_partition_id(key_data)
-            try:
-                partition_to_keys[partition_id][key] = key_data
-            except KeyError:
-                partition_to_keys[partition_id] = {key: key_data}
+            if key is None:
+                raise AssertionError(_KEY_NONE_MSG)
+            key_data = to_data(key)
+            partition_to_keys[get_partition_id(key_data)][key] = key_data
 
         return self._get_all_internal(partition_to_keys)
 
@@ -727,20 +805,9 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             EntryView of the specified key.
         """
         check_not_none(key, "key can't be None")
-
-        def handler(message):
-            response = map_get_entry_view_codec.decode_response(message)
-            entry_view = response["response"]
-            if not entry_view:
-                return None
-
-            entry_view.key = self._to_object(entry_view.key)
-            entry_view.value = self._to_object(entry_view.value)
-            return entry_view
-
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         request = map_get_entry_view_codec.encode_request(self.name, key_data, thread_id())
-        return self._invoke_on_key(request, key_data, handler)
+        return self._invoke_on_key(request, key_data, self._get_entry_view_response_handler)
 
     def is_empty(self) -> Future[bool]:
         """Returns whether this map contains no key-value mappings or not.
@@ -749,7 +816,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             ``True`` if this map contains no key-value mappings, ``False``
             otherwise.
         """
-        request = map_is_empty_codec.encode_request(self.name)
+        request = self._encode_is_empty_request()
         return self._invoke(request, map_is_empty_codec.decode_response)
 
     def is_locked(self, key: KeyType) -> Future[bool]:
@@ -767,12 +834,14 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             ``True`` if lock is acquired, ``False`` otherwise.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
 
         request = map_is_locked_codec.encode_request(self.name, key_data)
         return self._invoke_on_key(request, key_data, map_is_locked_codec.decode_response)
 
-    def key_set(self, predicate: Predicate = None) -> Future[typing.List[ValueType]]:
+    def key_set(
+        self, predicate: Predicate = None, eager: bool = False
+    ) -> Future[typing.List[ValueType]]:
         """Returns a List clone of the keys contained in this map or the keys
         of the entries filtered with the predicate if provided.
 
@@ -782,38 +851,40 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
 
         Args:
             predicate: Predicate to filter the entries.
+            eager: Whether to deserialize all the keys when the response
+                is received. By default, they are deserialized lazily, on
+                first access. Eager deserialization is cheaper when the
+                whole list is going to be iterated anyway.
 
         Returns:
             A list of the clone of the keys.
         """
+        list_factory = _deserialize_list if eager else ImmutableLazyDataList
         if predicate:
             if isinstance(predicate, PagingPredicate):
                 codec = map_key_set_with_paging_predicate_codec
-
-                def handler(message):
-                    response = codec.decode_response(message)
-                    predicate.anchor_list = response["anchor_data_list"].as_anchor_list(
-                        self._to_object
-                    )
-                    return ImmutableLazyDataList(response["response"], self._to_object)
-
+                handler = functools.partial(
+                    _paging_predicate_response_handler,
+                    codec,
+                    predicate,
+                    list_factory,
+                    self._to_object,
+                )
                 predicate.iteration_type = IterationType.KEY
                 holder = PagingPredicateHolder.of(predicate, self._to_data)
                 request = codec.encode_request(self.name, holder)
             else:
                 codec = map_key_set_with_predicate_codec
-
-                def handler(message):
-                    return ImmutableLazyDataList(codec.decode_response(message), self._to_object)
-
+                handler = functools.partial(
+                    _data_list_response_handler, codec, list_factory, self._to_object
+                )
                 predicate_data = self._to_data(predicate)
                 request = codec.encode_request(self.name, predicate_data)
         else:
             codec = map_key_set_codec
-
-            def handler(message):
-                return ImmutableLazyDataList(codec.decode_response(message), self._to_object)
-
+            handler = functools.partial(
+                _data_list_response_handler, codec, list_factory, self._to_object
+            )
             request = codec.encode_request(self.name)
 
         return self._invoke(request, handler)
@@ -869,7 +940,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             lease_time: Time in seconds to wait before releasing the lock.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
 
         request = map_lock_codec.encode_request(
             self.name,
@@ -878,7 +949,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             to_millis(lease_time),
             self._reference_id_generator.get_and_increment(),
         )
-        partition_id = self._context.partition_service.get_partition_id(key_data)
+        partition_id = self._partition_service.get_partition_id(key_data)
         invocation = Invocation(request, partition_id=partition_id, timeout=MAX_SIZE)
         self._invocation_service.invoke(invocation)
         return invocation.future
@@ -903,23 +974,16 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             if isinstance(predicate, PagingPredicate):
                 raise AssertionError("Paging predicate is not supported.")
 
-            def handler(message):
-                return ImmutableLazyDataList(
-                    map_project_with_predicate_codec.decode_response(message), self._to_object
-                )
-
+            codec = map_project_with_predicate_codec
             predicate_data = self._to_data(predicate)
-            request = map_project_with_predicate_codec.encode_request(
-                self.name, projection_data, predicate_data
-            )
-            return self._invoke(request, handler)
-
-        def handler(message):
-            return ImmutableLazyDataList(
-                map_project_codec.decode_response(message), self._to_object
-            )
+            request = codec.encode_request(self.name, projection_data, predicate_data)
+        else:
+            codec = map_project_codec
+            request = codec.encode_request(self.name, projection_data)
 
-        request = map_project_codec.encode_request(self.name, projection_data)
+        handler = functools.partial(
+            _data_list_response_handler, codec, ImmutableLazyDataList, self._to_object
+        )
         return self._invoke(request, handler)
 
     def put(
@@ -958,7 +1022,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         value_data = self._to_data(value)
         return self._put_internal(key_data, value_data, ttl, max_idle)
 
@@ -975,28 +1039,84 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         if not map:
             return ImmediateFuture(None)
 
-        partition_service = self._context.partition_service
-        partition_map = {}
+        if None in map:
+            raise AssertionError(_KEY_NONE_MSG)
+
+        to_data = self._to_data
+        get_partition_id = self._partition_service.get_partition_id
+        partition_map = collections.defaultdict(list)
 
         for key, value in map.items():
-            check_not_none(key, "key can't be None")
-            check_not_none(value, "value can't be None")
-            entry = (self._to_data(key), self._to_data(value))
-            partition_id = partition_service.get_partition_id(entry[0])
-            try:
-                partition_map[partition_id].append(entry)
-            except KeyError:
-                partition_map[partition_id] = [entry]
+            if value is None:
+                raise AssertionError(_VALUE_NONE_MSG)
+            key_data = to_data(key)
+            partition_map[get_partition_id(key_data)].append((key_data, to_data(value)))
+
+        name = self.name
+        invoke_on_partition = self._invoke_on_partition
+        # TODO trigger map loader
+        if len(partition_map) == 1:
+            # No need to combine anything, the put all
+            # request itself resolves to None.
+            partition_id, entry_list = partition_map.popitem()
+            request = map_put_all_codec.encode_request(name, entry_list, False)
+            return invoke_on_partition(request, partition_id)
+
+        futures = [
+            invoke_on_partition(
+                map_put_all_codec.encode_request(name, entry_list, False), partition_id
+            )
+            for partition_id, entry_list in partition_map.items()
+        ]
+        # Resolves to None, like the single partition and empty map
+        # cases, rather than to the list of the combined results.
+        return combine_futures(futures).continue_with(_discard_result)
+
+    def put_coalesced(
+        self, key: KeyType, value: ValueType, max_delay: float = 0.001, max_batch: int = 500
+    ) -> Future[None]:
+        """Associates the specified value with the specified key in this map,
+        coalescing the entry with the other entries put with this method.
 
-        futures = []
-        for partition_id, entry_list in partition_map.items():
-            request = map_put_all_codec.encode_request(
-                self.name, entry_list, False
-            )  # TODO trigger map loader
-            future = self._invoke_on_partition(request, partition_id)
-            futures.append(future)
+        The entry is buffered for at most ``max_delay`` seconds, or until
+        ``max_batch`` entries are buffered, and then sent together with the
+        other buffered entries, in a single put all request per partition.
+        This amortizes the per-request overhead for workloads that put many
+        individual entries in bursts from multiple threads, or without
+        waiting for the returned futures one by one.
 
-        return combine_futures(futures)
+        Unlike ``put``, this method does not return the previous value.
+        Entries of the same partition are written in the order they are put,
+        but no ordering is guaranteed with respect to the other operations.
+
+        Entries still buffered when the map is destroyed are sent before the
+        destroy request. The futures of the entries that are still buffered
+        when the client shuts down fail with
+        :class:`hazelcast.errors.HazelcastClientNotActiveError`.
+
+        This method is not available on the blocking map, as waiting for
+        each entry to be sent leaves nothing to coalesce.
+
+        Warning:
+            This method uses ``__hash__`` and ``__eq__`` methods of binary form
+            of the key, not the actual implementations of ``__hash__`` and
+            ``__eq__`` defined in key's class.
+
+        Args:
+            key: The specified key.
+            value: The value to associate with the key.
+            max_delay: Maximum time in seconds the entry is buffered before
+                it is sent.
+            max_batch: Number of buffered entries that triggers sending them
+                without waiting for the delay.
+        """
+        check_not_none(key, "key can't be None")
+        check_not_none(value, "value can't be None")
+        check_not_negative(max_delay, "max_delay can't be negative")
+        check_true(max_batch > 0, "max_batch must be positive")
+        key_data = self._key_to_data(key)
+        value_data = self._to_data(value)
+        return self._put_coalesced_internal(key_data, value_data, max_delay, max_batch)
 
     def put_if_absent(
         self, key: KeyType, value: ValueType, ttl: float = None, max_idle: float = None
@@ -1041,7 +1161,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
 
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         value_data = self._to_data(value)
         return self._put_if_absent_internal(key_data, value_data, ttl, max_idle)
 
@@ -1071,7 +1191,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
 
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         value_data = self._to_data(value)
         return self._put_transient_internal(key_data, value_data, ttl, max_idle)
 
@@ -1094,7 +1214,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             no mapping for key.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         return self._remove_internal(key_data)
 
     def remove_if_same(self, key: KeyType, value: ValueType) -> Future[bool]:
@@ -1125,7 +1245,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
 
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         value_data = self._to_data(value)
         return self._remove_if_same_internal_(key_data, value_data)
 
@@ -1188,7 +1308,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
 
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         value_data = self._to_data(value)
 
         return self._replace_internal(key_data, value_data)
@@ -1225,7 +1345,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         check_not_none(old_value, "old_value can't be None")
         check_not_none(new_value, "new_value can't be None")
 
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         old_value_data = self._to_data(old_value)
         new_value_data = self._to_data(new_value)
 
@@ -1259,7 +1379,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         value_data = self._to_data(value)
         return self._set_internal(key_data, value_data, ttl, max_idle)
 
@@ -1278,7 +1398,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
         check_not_none(ttl, "ttl can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         return self._set_ttl_internal(key_data, ttl)
 
     def size(self) -> Future[int]:
@@ -1287,7 +1407,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         Returns:
             Number of entries in this map.
         """
-        request = map_size_codec.encode_request(self.name)
+        request = self._encode_size_request()
         return self._invoke(request, map_size_codec.decode_response)
 
     def try_lock(self, key: KeyType, lease_time: float = None, timeout: float = 0) -> Future[bool]:
@@ -1317,7 +1437,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
 
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         request = map_try_lock_codec.encode_request(
             self.name,
             key_data,
@@ -1326,7 +1446,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             to_millis(timeout),
             self._reference_id_generator.get_and_increment(),
         )
-        partition_id = self._context.partition_service.get_partition_id(key_data)
+        partition_id = self._partition_service.get_partition_id(key_data)
         invocation = Invocation(
             request,
             partition_id=partition_id,
@@ -1354,7 +1474,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
 
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         value_data = self._to_data(value)
 
         return self._try_put_internal(key_data, value_data, timeout)
@@ -1375,7 +1495,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
 
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         return self._try_remove_internal(key_data, timeout)
 
     def unlock(self, key: KeyType) -> Future[None]:
@@ -1390,13 +1510,15 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         """
         check_not_none(key, "key can't be None")
 
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         request = map_unlock_codec.encode_request(
             self.name, key_data, thread_id(), self._reference_id_generator.get_and_increment()
         )
         return self._invoke_on_key(request, key_data)
 
-    def values(self, predicate: Predicate = None) -> Future[typing.List[ValueType]]:
+    def values(
+        self, predicate: Predicate = None, eager: bool = False
+    ) -> Future[typing.List[ValueType]]:
         """Returns a list clone of the values contained in this map or values
         of the entries which are filtered with the predicate if provided.
 
@@ -1406,38 +1528,40 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
 
         Args:
             predicate: Predicate to filter the entries.
+            eager: Whether to deserialize all the values when the response
+                is received. By default, they are deserialized lazily, on
+                first access. Eager deserialization is cheaper when the
+                whole list is going to be iterated anyway.
 
         Returns:
             A list of clone of the values contained in this map.
         """
+        list_factory = _deserialize_list if eager else ImmutableLazyDataList
         if predicate:
             if isinstance(predicate, PagingPredicate):
                 codec = map_values_with_paging_predicate_codec
-
-                def handler(message):
-                    response = codec.decode_response(message)
-                    predicate.anchor_list = response["anchor_data_list"].as_anchor_list(
-                        self._to_object
-                    )
-                    return ImmutableLazyDataList(response["response"], self._to_object)
-
+                handler = functools.partial(
+                    _paging_predicate_response_handler,
+                    codec,
+                    predicate,
+                    list_factory,
+                    self._to_object,
+                )
                 predicate.iteration_type = IterationType.VALUE
                 holder = PagingPredicateHolder.of(predicate, self._to_data)
                 request = codec.encode_request(self.name, holder)
             else:
                 codec = map_values_with_predicate_codec
-
-                def handler(message):
-                    return ImmutableLazyDataList(codec.decode_response(message), self._to_object)
-
+                handler = functools.partial(
+                    _data_list_response_handler, codec, list_factory, self._to_object
+                )
                 predicate_data = self._to_data(predicate)
                 request = codec.encode_request(self.name, predicate_data)
         else:
             codec = map_values_codec
-
-            def handler(message):
-                return ImmutableLazyDataList(codec.decode_response(message), self._to_object)
-
+            handler = functools.partial(
+                _data_list_response_handler, codec, list_factory, self._to_object
+            )
             request = codec.encode_request(self.name)
 
         return self._invoke(request, handler)
@@ -1445,43 +1569,61 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
     def blocking(self) -> "BlockingMap[KeyType, ValueType]":
         return BlockingMap(self)
 
+    def _on_destroy(self):
+        # The buffered entries are sent before the map is destroyed
+        self._put_coalescer._flush()
+
+    def _on_shutdown(self):
+        self._put_coalescer.shutdown()
+
     # internals
+    def _key_to_data(self, key):
+        key_type = type(key)
+        if key_type is int or (key_type is str and len(key) <= _KEY_DATA_CACHE_MAX_STR_LENGTH):
+            # Serialized forms of immutable str and int keys never change,
+            # so they can be reused across calls. Other types are not cached,
+            # as they might be mutable or compare equal to keys that
+            # serialize differently (e.g. True == 1). Long strings are not
+            # cached either, to bound the memory held by the cache.
+            return self._cached_key_to_data(key)
+        return self._to_data(key)
+
     def _contains_key_internal(self, key_data):
-        request = map_contains_key_codec.encode_request(self.name, key_data, thread_id())
+        request = self._encode_contains_key_request(key_data, thread_id())
         return self._invoke_on_key(request, key_data, map_contains_key_codec.decode_response)
 
     def _get_internal(self, key_data):
-        def handler(message):
-            return self._to_object(map_get_codec.decode_response(message))
-
-        request = map_get_codec.encode_request(self.name, key_data, thread_id())
-        return self._invoke_on_key(request, key_data, handler)
+        request = self._encode_get_request(key_data, thread_id())
+        return self._invoke_on_key(request, key_data, self._get_response_handler)
 
-    def _get_all_internal(self, partition_to_keys, futures=None):
-        if futures is None:
-            futures = []
+    def _get_all_internal(self, partition_to_keys, result=None):
+        # The responses are merged into the result dictionary, which
+        # may already contain the entries found locally.
+        if result is None:
+            result = {}
 
-        def handler(message):
-            return ImmutableLazyDataList(
-                map_get_all_codec.decode_response(message), self._to_object
+        name = self.name
+        invoke_on_partition = self._invoke_on_partition
+        futures = []
+        for partition_id, key_dict in partition_to_keys.items():
+            request = map_get_all_codec.encode_request(name, key_dict.values())
+            futures.append(
+                invoke_on_partition(request, partition_id, map_get_all_codec.decode_response)
             )
 
-        for partition_id, key_dict in partition_to_keys.items():
-            request = map_get_all_codec.encode_request(self.name, key_dict.values())
-            future = self._invoke_on_partition(request, partition_id, handler)
-            futures.append(future)
+        to_object = self._to_object
 
         def merge(f):
-            return dict(itertools.chain(*f.result()))
+            for entries in f.result():
+                for key_data, value_data in entries:
+                    result[to_object(key_data)] = to_object(value_data)
+            return result
 
         return combine_futures(futures).continue_with(merge)
 
     def _remove_internal(self, key_data):
-        def handler(message):
-            return self._to_object(map_remove_codec.decode_response(message))
-
-        request = map_remove_codec.encode_request(self.name, key_data, thread_id())
-        return self._invoke_on_key(request, key_data, handler)
+        request = self._encode_remove_request(key_data, thread_id())
+        return self._invoke_on_key(request, key_data, self._remove_response_handler)
 
     def _remove_if_same_internal_(self, key_data, value_data):
         request = map_remove_if_same_codec.encode_request(
@@ -1492,22 +1634,17 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         )
 
     def _delete_internal(self, key_data):
-        request = map_delete_codec.encode_request(self.name, key_data, thread_id())
+        request = self._encode_delete_request(key_data, thread_id())
         return self._invoke_on_key(request, key_data)
 
     def _put_internal(self, key_data, value_data, ttl, max_idle):
-        def handler(message):
-            return self._to_object(map_put_codec.decode_response(message))
-
         if max_idle is not None:
             request = map_put_with_max_idle_codec.encode_request(
                 self.name, key_data, value_data, thread_id(), to_millis(ttl), to_millis(max_idle)
             )
         else:
-            request = map_put_codec.encode_request(
-                self.name, key_data, value_data, thread_id(), to_millis(ttl)
-            )
-        return self._invoke_on_key(request, key_data, handler)
+            request = self._encode_put_request(key_data, value_data, thread_id(), to_millis(ttl))
+        return self._invoke_on_key(request, key_data, self._put_response_handler)
 
     def _set_internal(self, key_data, value_data, ttl, max_idle):
         if max_idle is not None:
@@ -1515,9 +1652,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
                 self.name, key_data, value_data, thread_id(), to_millis(ttl), to_millis(max_idle)
             )
         else:
-            request = map_set_codec.encode_request(
-                self.name, key_data, value_data, thread_id(), to_millis(ttl)
-            )
+            request = self._encode_set_request(key_data, value_data, thread_id(), to_millis(ttl))
         return self._invoke_on_key(request, key_data)
 
     def _set_ttl_internal(self, key_data, ttl):
@@ -1547,10 +1682,10 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             )
         return self._invoke_on_key(request, key_data)
 
-    def _put_if_absent_internal(self, key_data, value_data, ttl, max_idle):
-        def handler(message):
-            return self._to_object(map_put_if_absent_codec.decode_response(message))
+    def _put_coalesced_internal(self, key_data, value_data, max_delay, max_batch):
+        return self._put_coalescer.put(key_data, value_data, max_delay, max_batch)
 
+    def _put_if_absent_internal(self, key_data, value_data, ttl, max_idle):
         if max_idle is not None:
             request = map_put_if_absent_with_max_idle_codec.encode_request(
                 self.name, key_data, value_data, thread_id(), to_millis(ttl), to_millis(max_idle)
@@ -1559,7 +1694,7 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
             request = map_put_if_absent_codec.encode_request(
                 self.name, key_data, value_data, thread_id(), to_millis(ttl)
             )
-        return self._invoke_on_key(request, key_data, handler)
+        return self._invoke_on_key(request, key_data, self._put_if_absent_response_handler)
 
     def _replace_if_same_internal(self, key_data, old_value_data, new_value_data):
         request = map_replace_if_same_codec.encode_request(
@@ -1568,11 +1703,8 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         return self._invoke_on_key(request, key_data, map_replace_if_same_codec.decode_response)
 
     def _replace_internal(self, key_data, value_data):
-        def handler(message):
-            return self._to_object(map_replace_codec.decode_response(message))
-
         request = map_replace_codec.encode_request(self.name, key_data, value_data, thread_id())
-        return self._invoke_on_key(request, key_data, handler)
+        return self._invoke_on_key(request, key_data, self._replace_response_handler)
 
     def _evict_internal(self, key_data):
         request = map_evict_codec.encode_request(self.name, key_data, thread_id())
@@ -1585,14 +1717,11 @@ class Map(Proxy["BlockingMap"], typing.Generic[KeyType, ValueType]):
         return self._invoke(request)
 
     def _execute_on_key_internal(self, key_data, entry_processor):
-        def handler(message):
-            return self._to_object(map_execute_on_key_codec.decode_response(message))
-
         entry_processor_data = self._to_data(entry_processor)
         request = map_execute_on_key_codec.encode_request(
             self.name, entry_processor_data, key_data, thread_id()
         )
-        return self._invoke_on_key(request, key_data, handler)
+        return self._invoke_on_key(request, key_data, self._execute_on_key_response_handler)
 
 
 class MapFeatNearCache(Map[KeyType, ValueType]):
@@ -1610,7 +1739,7 @@ class MapFeatNearCache(Map[KeyType, ValueType]):
         return super(MapFeatNearCache, self).clear()
 
     def evict_all(self):
-        self._near_cache.clear()
+        self._near_cache._clear()
         return super(MapFeatNearCache, self).evict_all()
 
     def load_all(self, keys=None, replace_existing_values=True):
@@ -1647,24 +1776,19 @@ class MapFeatNearCache(Map[KeyType, ValueType]):
         if key is None:
             self._near_cache._clear()
         else:
-            self._invalidate_cache(key)
+            self._near_cache._invalidate(key)
 
     def _handle_batch_invalidation(self, keys, source_uuids, partition_uuids, sequences):
         # key_list is always list of ``Data``
-        for key_data in keys:
-            self._invalidate_cache(key_data)
-
-    def _invalidate_cache(self, key_data):
-        self._near_cache._invalidate(key_data)
-
-    def _invalidate_cache_batch(self, key_data_list):
-        for key_data in key_data_list:
-            self._near_cache._invalidate(key_data)
+        self._near_cache._invalidate_many(keys)
 
     # internals
     def _contains_key_internal(self, key_data):
         try:
-            return self._near_cache[key_data]
+            # Lookup goes through __getitem__ so that expired
+            # records are not reported as present
+            self._near_cache[key_data]
+            return ImmediateFuture(True)
         except KeyError:
             return super(MapFeatNearCache, self)._contains_key_internal(key_data)
 
@@ -1677,90 +1801,107 @@ class MapFeatNearCache(Map[KeyType, ValueType]):
             return future.continue_with(self._update_cache, key_data)
 
     def _update_cache(self, f, key_data):
-        self._near_cache.__setitem__(key_data, f.result())
-        return f.result()
-
-    def _get_all_internal(self, partition_to_keys, futures=None):
-        if futures is None:
-            futures = []
-        for key_dic in partition_to_keys.values():
-            for key in list(key_dic.keys()):
-                try:
-                    key_data = key_dic[key]
-                    value = self._near_cache[key_data]
-                    future = ImmediateFuture((key, value))
-                    futures.append(future)
-                    del key_dic[key]
-                except KeyError:
-                    pass
-        return super(MapFeatNearCache, self)._get_all_internal(partition_to_keys, futures)
+        value = f.result()
+        self._near_cache[key_data] = value
+        return value
+
+    def _get_all_internal(self, partition_to_keys, result=None):
+        if result is None:
+            result = {}
+        get_many = self._near_cache._get_many
+        remaining = {}
+        for partition_id, key_dic in partition_to_keys.items():
+            missing = {}
+            values = get_many(key_dic.values(), _NEAR_CACHE_MISS)
+            for (key, key_data), value in zip(key_dic.items(), values):
+                if value is _NEAR_CACHE_MISS:
+                    missing[key] = key_data
+                else:
+                    result[key] = value
+            if missing:
+                # Partitions whose keys are all found in the near cache are dropped
+                remaining[partition_id] = missing
+        return super(MapFeatNearCache, self)._get_all_internal(remaining, result)
 
     def _try_remove_internal(self, key_data, timeout):
-        self._invalidate_cache(key_data)
+        self._near_cache._invalidate(key_data)
         return super(MapFeatNearCache, self)._try_remove_internal(key_data, timeout)
 
     def _try_put_internal(self, key_data, value_data, timeout):
-        self._invalidate_cache(key_data)
+        self._near_cache._invalidate(key_data)
         return super(MapFeatNearCache, self)._try_put_internal(key_data, value_data, timeout)
 
     def _set_internal(self, key_data, value_data, ttl, max_idle):
-        self._invalidate_cache(key_data)
+        self._near_cache._invalidate(key_data)
         return super(MapFeatNearCache, self)._set_internal(key_data, value_data, ttl, max_idle)
 
     def _set_ttl_internal(self, key_data, ttl):
-        self._invalidate_cache(key_data)
+        self._near_cache._invalidate(key_data)
         return super(MapFeatNearCache, self)._set_ttl_internal(key_data, ttl)
 
     def _replace_internal(self, key_data, value_data):
-        self._invalidate_cache(key_data)
+        self._near_cache._invalidate(key_data)
         return super(MapFeatNearCache, self)._replace_internal(key_data, value_data)
 
     def _replace_if_same_internal(self, key_data, old_value_data, new_value_data):
-        self._invalidate_cache(key_data)
+        self._near_cache._invalidate(key_data)
         return super(MapFeatNearCache, self)._replace_if_same_internal(
             key_data, old_value_data, new_value_data
         )
 
     def _remove_internal(self, key_data):
-        self._invalidate_cache(key_data)
+        self._near_cache._invalidate(key_data)
         return super(MapFeatNearCache, self)._remove_internal(key_data)
 
     def _remove_if_same_internal_(self, key_data, value_data):
-        self._invalidate_cache(key_data)
+        self._near_cache._invalidate(key_data)
         return super(MapFeatNearCache, self)._remove_if_same_internal_(key_data, value_data)
 
     def _put_transient_internal(self, key_data, value_data, ttl, max_idle):
-        self._invalidate_cache(key_data)
+        self._near_cache._invalidate(key_data)
         return super(MapFeatNearCache, self)._put_transient_internal(
             key_data, value_data, ttl, max_idle
         )
 
     def _put_internal(self, key_data, value_data, ttl, max_idle):
-        self._invalidate_cache(key_data)
+        self._near_cache._invalidate(key_data)
         return super(MapFeatNearCache, self)._put_internal(key_data, value_data, ttl, max_idle)
 
+    def _put_coalesced_internal(self, key_data, value_data, max_delay, max_batch):
+        self._near_cache._invalidate(key_data)
+        future = super(MapFeatNearCache, self)._put_coalesced_internal(
+            key_data, value_data, max_delay, max_batch
+        )
+        # The entry is sent later, so a get in between
+        # might have cached the old value again.
+        return future.continue_with(self._invalidate_cache, key_data)
+
+    def _invalidate_cache(self, f, key_data):
+        self._near_cache._invalidate(key_data)
+        return f.result()
+
     def _put_if_absent_internal(self, key_data, value_data, ttl, max_idle):
-        self._invalidate_cache(key_data)
+        self._near_cache._invalidate(key_data)
         return super(MapFeatNearCache, self)._put_if_absent_internal(
             key_data, value_data, ttl, max_idle
         )
 
     def _load_all_internal(self, key_data_list, replace_existing_values):
-        self._invalidate_cache_batch(key_data_list)
+        self._near_cache._invalidate_many(key_data_list)
         return super(MapFeatNearCache, self)._load_all_internal(
             key_data_list, replace_existing_values
         )
 
     def _execute_on_key_internal(self, key_data, entry_processor):
-        self._invalidate_cache(key_data)
+        self._near_cache._invalidate(key_data)
         return super(MapFeatNearCache, self)._execute_on_key_internal(key_data, entry_processor)
 
     def _evict_internal(self, key_data):
-        self._invalidate_cache(key_data)
+        self._near_cache._invalidate(key_data)
         return super(MapFeatNearCache, self)._evict_internal(key_data)
 
     def _delete_internal(self, key_data):
-        self._invalidate_cache(key_data)
+        self._near_cache._invalidate(key_data)
         return super(MapFeatNearCache, self)._delete_internal(key_data)
 
 
@@ -1852,8 +1993,9 @@ class BlockingMap(Map[KeyType, ValueType]):
     def entry_set(  # type: ignore[override]
         self,
         predicate: Predicate = None,
+        eager: bool = False,
     ) -> typing.List[typing.Tuple[KeyType, ValueType]]:
-        return self._wrapped.entry_set(predicate).result()
+        return self._wrapped.entry_set(predicate, eager).result()
 
     def evict(  # type: ignore[override]
         self,
@@ -1930,8 +2072,9 @@ class BlockingMap(Map[KeyType, ValueType]):
     def key_set(  # type: ignore[override]
         self,
         predicate: Predicate = None,
+        eager: bool = False,
     ) -> typing.List[ValueType]:
-        return self._wrapped.key_set(predicate).result()
+        return self._wrapped.key_set(predicate, eager).result()
 
     def load_all(  # type: ignore[override]
         self,
@@ -1969,6 +2112,15 @@ class BlockingMap(Map[KeyType, ValueType]):
     ) -> None:
         return self._wrapped.put_all(map).result()
 
+    def put_coalesced(  # type: ignore[override]
+        self,
+        key: KeyType,
+        value: ValueType,
+        max_delay: float = 0.001,
+        max_batch: int = 500,
+    ) -> None:
+        raise NotImplementedError("put_coalesced is only available on the non-blocking map")
+
     def put_if_absent(  # type: ignore[override]
         self,
         key: KeyType,
@@ -2080,8 +2232,9 @@ class BlockingMap(Map[KeyType, ValueType]):
     def values(  # type: ignore[override]
         self,
         predicate: Predicate = None,
+        eager: bool = False,
     ) -> typing.List[ValueType]:
-        return self._wrapped.values(predicate).result()
+        return self._wrapped.values(predicate, eager).result()
 
     def blocking(self) -> "BlockingMap[KeyType, ValueType]":
         return self
@@ -2093,6 +2246,270 @@ class BlockingMap(Map[KeyType, ValueType]):
         return self._wrapped.__repr__()
 
 
+def _validate_index_config(map_name, attributes, index_type, name, bitmap_index_options):
+    d = {
+        "name": name,
+        "type": index_type,
+        "attributes": attributes,
+        "bitmap_index_options": bitmap_index_options,
+    }
+    config = IndexConfig.from_dict(d)
+    return IndexUtil.validate_and_normalize(map_name, config)
+
+
+class _NameRequestEncoder:
+    """Encodes the requests of a codec by copying a request encoded once by
+    the codec, with the name and empty parameters.
+
+    Subclasses complete the copy with the data parameters that follow the
+    name frame, and with the fix sized parameters in the initial frame,
+    at the offsets defined by the codec. The arguments of the encoder are
+    the arguments of the codec that follow the name.
+    """
+
+    __slots__ = ("_template", "_retryable")
+
+    # Number of data frames that follow the name frame
+    _DATA_FRAME_COUNT = 0
+
+    # Arguments used to encode the template, and to check it
+    _EMPTY_ARGS = ()
+    _SAMPLE_ARGS = ()
+
+    def __init__(self, codec, name):
+        message = codec.encode_request(name, *self._EMPTY_ARGS)
+        template = message.buf
+        # Strip the frames of the empty data parameters
+        data_frames_size = self._DATA_FRAME_COUNT * SIZE_OF_FRAME_LENGTH_AND_FLAGS
+        self._template = bytes(template[: len(template) - data_frames_size])
+        self._retryable = message.retryable
+        self._init_offsets(codec)
+
+        # The template relies on the frame layout of the codec,
+        # so a codec that no longer matches it must not go unnoticed.
+        expected = codec.encode_request(name, *self._SAMPLE_ARGS)
+        actual = self(*self._SAMPLE_ARGS)
+        check_true(
+            expected.buf == actual.buf and expected.retryable == actual.retryable,
+            "Request template does not match the encoding of %s" % codec.__name__,
+        )
+
+    def _init_offsets(self, codec):
+        # Reads the offsets of the fix sized parameters from the codec
+        pass
+
+    def __call__(self):
+        return OutboundMessage(bytearray(self._template), self._retryable)
+
+
+class _ValueRequestEncoder(_NameRequestEncoder):
+    __slots__ = ()
+
+    _DATA_FRAME_COUNT = 1
+    _EMPTY_ARGS = (_EMPTY_DATA,)
+    _SAMPLE_ARGS = (_SAMPLE_VALUE_DATA,)
+
+    def __call__(self, value):
+        buf = bytearray(self._template)
+        DataCodec.encode(buf, value, True)
+        return OutboundMessage(buf, self._retryable)
+
+
+class _KeyRequestEncoder(_NameRequestEncoder):
+    __slots__ = ("_thread_id_offset",)
+
+    _DATA_FRAME_COUNT = 1
+    _EMPTY_ARGS = (_EMPTY_DATA, 0)
+    _SAMPLE_ARGS = (_SAMPLE_KEY_DATA, 42)
+
+    def _init_offsets(self, codec):
+        self._thread_id_offset = codec._REQUEST_THREAD_ID_OFFSET
+
+    def __call__(self, key, thread_id):
+        buf = bytearray(self._template)
+        LE_LONG.pack_into(buf, self._thread_id_offset, thread_id)
+        DataCodec.encode(buf, key, True)
+        return OutboundMessage(buf, self._retryable)
+
+
+class _EntryRequestEncoder(_NameRequestEncoder):
+    __slots__ = ("_thread_id_offset", "_ttl_offset")
+
+    _DATA_FRAME_COUNT = 2
+    _EMPTY_ARGS = (_EMPTY_DATA, _EMPTY_DATA, 0, 0)
+    _SAMPLE_ARGS = (_SAMPLE_KEY_DATA, _SAMPLE_VALUE_DATA, 42, 1234)
+
+    def _init_offsets(self, codec):
+        self._thread_id_offset = codec._REQUEST_THREAD_ID_OFFSET
+        self._ttl_offset = codec._REQUEST_TTL_OFFSET
+
+    def __call__(self, key, value, thread_id, ttl):
+        buf = bytearray(self._template)
+        LE_LONG.pack_into(buf, self._thread_id_offset, thread_id)
+        LE_LONG.pack_into(buf, self._ttl_offset, ttl)
+        DataCodec.encode(buf, key)
+        DataCodec.encode(buf, value, True)
+        return OutboundMessage(buf, self._retryable)
+
+
+def _deserialize_list(data_list, to_object):
+    return [to_object(data) for data in data_list]
+
+
+def _deserialize_entry_list(entry_data_list, to_object):
+    return [(to_object(key), to_object(value)) for key, value in entry_data_list]
+
+
+def _object_response_handler(codec, to_object, message):
+    return to_object(codec.decode_response(message))
+
+
+def _data_list_response_handler(codec, list_factory, to_object, message):
+    return list_factory(codec.decode_response(message), to_object)
+
+
+def _entry_view_response_handler(to_object, message):
+    entry_view = map_get_entry_view_codec.decode_response(message)["response"]
+    if not entry_view:
+        return None
+
+    entry_view.key = to_object(entry_view.key)
+    entry_view.value = to_object(entry_view.value)
+    return entry_view
+
+
+def _paging_predicate_response_handler(codec, predicate, list_factory, to_object, message):
+    response = codec.decode_response(message)
+    predicate.anchor_list = response["anchor_data_list"].as_anchor_list(to_object)
+    return list_factory(response["response"], to_object)
+
+
+class _PutCoalescer:
+    """Buffers the entries put with ``Map.put_coalesced`` and sends them
+    with a single put all request per partition, once the buffer is full or
+    the earliest deadline of the buffered entries has passed.
+    """
+
+    def __init__(self, map_proxy, reactor):
+        self._map = map_proxy
+        self._reactor = reactor
+        self._lock = threading.Lock()
+        # partition id -> (list of entries, list of futures)
+        self._batches = {}
+        self._entry_count = 0
+        self._flush_timer = None
+        self._flush_deadline = 0
+        self._shutdown = False
+
+    def put(self, key_data, value_data, max_delay, max_batch):
+        partition_id = self._map._partition_service.get_partition_id(key_data)
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                future.set_exception(HazelcastClientNotActiveError("Client is shutting down"))
+                return future
+
+            batch = self._batches.get(partition_id, None)
+            if batch is None:
+                batch = self._batches[partition_id] = ([], [])
+
+            batch[0].append((key_data, value_data))
+            batch[1].append(future)
+            self._entry_count += 1
+
+            if self._entry_count < max_batch:
+                deadline = time.time() + max_delay
+                if self._flush_timer is None or deadline < self._flush_deadline:
+                    # The flush is brought forward for an entry
+                    # with a shorter delay than the buffered ones.
+                    if self._flush_timer is not None:
+                        self._flush_timer.cancel()
+                    self._flush_deadline = deadline
+                    self._flush_timer = self._reactor.add_timer(max_delay, self._flush)
+                return future
+
+            # Sent under the lock, so that a later flush cannot overtake
+            # this one. That is fine, as invocations do not block.
+            sent = self._send(self._drain())
+
+        # Completed outside the lock, as the futures run user callbacks
+        _complete_on_response(sent)
+        return future
+
+    def shutdown(self):
+        """Fails the buffered entries and the entries put afterwards, as
+        they can no longer be sent once the client is shutting down.
+        """
+        with self._lock:
+            self._shutdown = True
+            batches = self._drain()
+
+        error = HazelcastClientNotActiveError("Client is shutting down")
+        for _, futures in batches.values():
+            for future in futures:
+                future.set_exception(error)
+
+    def _flush(self):
+        with self._lock:
+            # The timer might be fired just after the
+            # buffer is drained because it was full.
+            self._flush_timer = None
+            sent = self._send(self._drain())
+
+        _complete_on_response(sent)
+
+    def _drain(self):
+        batches = self._batches
+        self._batches = {}
+        self._entry_count = 0
+
+        flush_timer = self._flush_timer
+        if flush_timer is not None:
+            flush_timer.cancel()
+            self._flush_timer = None
+
+        return batches
+
+    def _send(self, batches):
+        # Returns the futures of each batch with the future of its
+        # invocation, to be completed by the caller after the lock
+        # is released.
+        map_proxy = self._map
+        sent = []
+        for partition_id, (entries, futures) in batches.items():
+            try:
+                request = map_put_all_codec.encode_request(map_proxy.name, entries, False)
+                invocation_future = map_proxy._invoke_on_partition(request, partition_id)
+            except Exception as e:
+                # This might be running on the reactor thread, as
+                # a timer callback. So, the error must not escape.
+                invocation_future = ImmediateExceptionFuture(e, e.__traceback__)
+
+            sent.append((futures, invocation_future))
+        return sent
+
+
+def _discard_result(future):
+    # Raises the error of the future, if any
+    future.result()
+
+
+def _complete_on_response(sent):
+    for futures, invocation_future in sent:
+        invocation_future.add_done_callback(functools.partial(_complete_futures, futures))
+
+
+def _complete_futures(futures, invocation_future):
+    if invocation_future.is_success():
+        for future in futures:
+            future.set_result(None)
+    else:
+        exception = invocation_future.exception()
+        traceback = invocation_future.traceback()
+        for future in futures:
+            future.set_exception(exception, traceback)
+
+
 def create_map_proxy(service_name, name, context):
     near_cache_config = context.config.near_caches.get(name, None)
     if near_cache_config is None:
@@ -27,7 +27,7 @@ _MAX_BACKOFF = 2.0
 _RINGBUFFER_PREFIX = "_hz_rb_"
 
 _UNKNOWN_MEMBER_VERSION = MemberVersion(0, 0, 0)
-_MEMBER_ENDPOINT_QUALIFIER = EndpointQualifier(ProtocolType.MEMBER, None)
+_MEMBER_ENDPOINT_QUALIFIER = EndpointQualifier.get(ProtocolType.MEMBER, None)
 
 _logger = logging.getLogger(__name__)
 
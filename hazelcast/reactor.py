@@ -45,6 +45,10 @@ _RETRYABLE_ERROR_CODES = (
     ssl.SSL_ERROR_WANT_READ,
 )
 
+# Maximum time the wakeable loop waits for socket events, before
+# checking the timers. Shorter timers wake the loop up earlier.
+_WAKEABLE_LOOP_POLL_TIMEOUT = 0.01
+
 
 def _set_nonblocking(fd):
     if not fcntl:
@@ -258,8 +262,20 @@ class _WakeableLoop(_AbstractLoop):
         self.run_loop()
         assert not self.waker.awake
 
+    def add_timer(self, delay, callback):
+        timer = _AbstractLoop.add_timer(self, delay, callback)
+        if delay < _WAKEABLE_LOOP_POLL_TIMEOUT:
+            # The loop might be polling for longer than the delay.
+            self.wake_loop()
+        return timer
+
     def run_loop(self):
-        asyncore.loop(timeout=0.01, use_poll=True, map=self._map, count=1)
+        timeout = _WAKEABLE_LOOP_POLL_TIMEOUT
+        timers = self._timers
+        if timers:
+            # Wake up in time for the earliest timer
+            timeout = max(0, min(timeout, timers[0][0] - time.time()))
+        asyncore.loop(timeout=timeout, use_poll=True, map=self._map, count=1)
 
     def wake_loop(self):
         if self._ident != get_ident():
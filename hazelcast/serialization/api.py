@@ -11,13 +11,20 @@ class ObjectDataOutput:
     write them on a stream.
     """
 
-    def write_from(self, buff: bytearray, offset: int = None, length: int = None) -> None:
+    def write_from(
+        self,
+        buff: typing.Union[bytes, bytearray, memoryview],
+        offset: int = None,
+        length: int = None,
+    ) -> None:
         """Writes the content of the buffer to this output stream.
 
         Args:
-            buff: Input buffer.
-            offset: Offset of the buffer where copy begin.
-            length: Length of data to be copied from the offset into stream.
+            buff: Input buffer. Any bytes-like object can be used, and the
+                bytes are copied from it without intermediate copies.
+            offset: Offset of the buffer where copy begin, in bytes.
+            length: Length of data to be copied from the offset into stream,
+                in bytes.
         """
         raise NotImplementedError()
 
@@ -233,16 +240,20 @@ class ObjectDataInput:
     reconstruct it to any of primitive types or arrays of them.
     """
 
-    def read_into(self, buff: bytearray, offset: int = None, length: int = None) -> bytearray:
-        """Reads the content of the buffer into an array of bytes.
+    def read_into(self, buff: bytearray, offset: int = None, length: int = None) -> int:
+        """Reads the content of the buffer into the given, preallocated
+        array of bytes, without allocating a new one.
 
         Args:
-            buff: Input buffer.
-            offset: Offset of the buffer where the read begin.
-            length: Length of data to be read.
+            buff: Output buffer to read the data into.
+            offset: Offset of the output buffer where the read begins.
+                Defaults to ``0``.
+            length: Length of data to be read. Defaults to the remaining
+                length of the output buffer after ``offset``.
 
         Returns:
-            The read data.
+            The number of bytes read, which might be less than ``length``
+            if the end of the input is reached.
         """
         raise NotImplementedError()
 
@@ -476,8 +487,13 @@ class IdentifiedDataSerializable:
 
     Each IdentifiedDataSerializable is created by a registered
     DataSerializableFactory.
+
+    This class declares empty ``__slots__``, so subclasses that declare
+    their own ``__slots__`` do not get a per-instance ``__dict__``.
     """
 
+    __slots__ = ()
+
     def write_data(self, object_data_output: ObjectDataOutput) -> None:
         """Writes object fields to output stream.
 
@@ -529,8 +545,13 @@ class Portable:
     - Support multiversion of the same object type.
     - Fetching individual fields without having to rely on reflection.
     - Querying and indexing support without de-serialization and/or reflection.
+
+    This class declares empty ``__slots__``, so subclasses that declare
+    their own ``__slots__`` do not get a per-instance ``__dict__``.
     """
 
+    __slots__ = ()
+
     def write_portable(self, writer: "PortableWriter") -> None:
         """Serialize this portable object using given PortableWriter.
 
@@ -568,6 +589,8 @@ class Portable:
 class StreamSerializer:
     """A base class for custom serialization."""
 
+    __slots__ = ()
+
     def write(self, out: ObjectDataOutput, obj: typing.Any) -> None:
         """Writes object to ObjectDataOutput
 
@@ -1,5 +1,5 @@
 import sys
-from threading import RLock
+from threading import RLock, local
 
 from hazelcast.config import IntType
 from hazelcast.serialization.api import *
@@ -50,6 +50,10 @@ class BaseSerializationService:
         self._output_buffer_size = output_buffer_size
         self._is_big_endian = is_big_endian
         self._active = True
+        # Per-thread free list of data outputs. A list rather than a single
+        # slot, since to_data may be re-entered while computing the
+        # partitioning hash or from user serializers.
+        self._free_outputs = local()
 
     def to_data(self, obj, partitioning_strategy=None):
         """Serialize the input object into byte array representation
@@ -67,7 +71,7 @@ class BaseSerializationService:
         if isinstance(obj, Data):
             return obj
 
-        out = self._create_data_output()
+        out = self._acquire_data_output()
         try:
             serializer = self._registry.serializer_for(obj)
             partitioning_hash = self._calculate_partitioning_hash(obj, partitioning_strategy)
@@ -78,6 +82,8 @@ class BaseSerializationService:
             return Data(out.to_byte_array())
         except:
             handle_exception(sys.exc_info()[1], sys.exc_info()[2])
+        finally:
+            self._release_data_output(out)
 
     def to_object(self, data):
         """Deserialize input data
@@ -152,6 +158,23 @@ class BaseSerializationService:
     def _create_data_output(self):
         return _ObjectDataOutput(self._output_buffer_size, self, self._is_big_endian)
 
+    def _acquire_data_output(self):
+        try:
+            return self._free_outputs.outputs.pop()
+        except (AttributeError, IndexError):
+            return self._create_data_output()
+
+    def _release_data_output(self, out):
+        if len(out._buffer) > self._output_buffer_size:
+            # Do not hold on to buffers grown by large objects
+            return
+
+        out.set_position(0)
+        try:
+            self._free_outputs.outputs.append(out)
+        except AttributeError:
+            self._free_outputs.outputs = [out]
+
     def _create_data_input(self, data):
         return _ObjectDataInput(data._buffer, DATA_OFFSET, self, self._is_big_endian)
 
@@ -17,6 +17,7 @@ class Data:
 
     def __init__(self, buf):
         self._buffer = buf
+        self._partition_hash = None
 
     def to_bytes(self):
         """Returns byte array representation of internal binary format.
@@ -60,13 +61,20 @@ class Data:
         - PartitioningStrategy during serialization.
         - If partition hash is not set then hash_code() is used.
 
+        The partition hash is computed once and reused on the subsequent
+        calls, as the same key data is hashed for every invocation made
+        with it.
+
         Returns:
             int: Partition hash.
         """
-        partition_hash = BE_INT.unpack_from(self._buffer, PARTITION_HASH_OFFSET)[0]
-        if partition_hash != 0:
-            return partition_hash
-        return self.hash_code()
+        partition_hash = self._partition_hash
+        if partition_hash is None:
+            partition_hash = BE_INT.unpack_from(self._buffer, PARTITION_HASH_OFFSET)[0]
+            if partition_hash == 0:
+                partition_hash = self.hash_code()
+            self._partition_hash = partition_hash
+        return partition_hash
 
     def is_portable(self):
         """Determines whether this Data is created from a ``Portable`` object or not.
@@ -1,3 +1,5 @@
+import struct
+
 from hazelcast.serialization.api import *
 from hazelcast.serialization.bits import *
 
@@ -18,20 +20,25 @@ class _ObjectDataInput(ObjectDataInput):
         self._FMT_LONG = BE_LONG if self._is_big_endian else LE_LONG
         self._FMT_FLOAT = BE_FLOAT if self._is_big_endian else LE_FLOAT
         self._FMT_DOUBLE = BE_DOUBLE if self._is_big_endian else LE_DOUBLE
+        self._BYTE_ORDER = ">" if self._is_big_endian else "<"
 
     def read_into(self, buff, offset=None, length=None):
         _off = offset if offset is not None else 0
-        _len = length if length is not None else len(buff)
-        if _off < 0 or _len < 0 or (_off + _len) > len(self._buffer):
+        _len = length if length is not None else len(buff) - _off
+        if _off < 0 or _len < 0 or (_off + _len) > len(buff):
             raise IndexError()
         elif _len == 0:
-            return
-        if self._pos > self._size:
+            return 0
+        pos = self._pos
+        if pos > self._size:
             raise IndexError()
-        if self._pos + _len > self._size:
-            _len = self._size - self._pos
-        buff[_off : _off + _len] = self._buffer[self._pos : self._pos + _len]
-        self._pos += _len
+        if pos + _len > self._size:
+            _len = self._size - pos
+        # Copy straight from a view of the input, so no intermediate
+        # bytes object is created for the slice.
+        buff[_off : _off + _len] = memoryview(self._buffer)[pos : pos + _len]
+        self._pos = pos + _len
+        return _len
 
     def skip_bytes(self, count):
         if count <= 0:
@@ -47,11 +54,9 @@ class _ObjectDataInput(ObjectDataInput):
         return self.read_byte(position) != 0
 
     def read_byte(self, position=None):
-        self._check_available(self._pos, BYTE_SIZE_IN_BYTES)
         return self._read_from_buff(self._FMT_INT8, BYTE_SIZE_IN_BYTES, position)
 
     def read_unsigned_byte(self, position=None):
-        self._check_available(self._pos, BYTE_SIZE_IN_BYTES)
         return self._read_from_buff(self._FMT_UINT8, BYTE_SIZE_IN_BYTES, position)
 
     def read_char(self, position=None):
@@ -59,37 +64,34 @@ class _ObjectDataInput(ObjectDataInput):
         return chr(char_ord)
 
     def read_short(self, position=None):
-        self._check_available(self._pos, SHORT_SIZE_IN_BYTES)
         return self._read_from_buff(self._FMT_SHORT, SHORT_SIZE_IN_BYTES, position)
 
     def read_unsigned_short(self, position=None):
-        self._check_available(self._pos, SHORT_SIZE_IN_BYTES)
         return self._read_from_buff(self._FMT_CHAR, SHORT_SIZE_IN_BYTES, position)
 
     def read_int(self, position=None):
-        self._check_available(position, INT_SIZE_IN_BYTES)
         return self._read_from_buff(self._FMT_INT, INT_SIZE_IN_BYTES, position)
 
     def read_long(self, position=None):
-        self._check_available(self._pos, LONG_SIZE_IN_BYTES)
         return self._read_from_buff(self._FMT_LONG, LONG_SIZE_IN_BYTES, position)
 
     def read_float(self, position=None):
-        self._check_available(self._pos, FLOAT_SIZE_IN_BYTES)
         return self._read_from_buff(self._FMT_FLOAT, FLOAT_SIZE_IN_BYTES, position)
 
     def read_double(self, position=None):
-        self._check_available(self._pos, DOUBLE_SIZE_IN_BYTES)
         return self._read_from_buff(self._FMT_DOUBLE, DOUBLE_SIZE_IN_BYTES, position)
 
     def read_string(self):
         length = self.read_int()
         if length == NULL_ARRAY_LENGTH:
             return None
-        result = bytearray(length)
-        if length > 0:
-            self.read_into(result, 0, length)
-        return result.decode("utf-8")
+        # Decoding a slice of the buffer copies the content once, but it
+        # is still cheaper than decoding through a memoryview for the
+        # typical string lengths.
+        self._check_available(self._pos, length)
+        pos = self._pos
+        self._pos = pos + length
+        return self._buffer[pos : pos + length].decode("utf-8")
 
     def read_byte_array(self):
         length = self.read_int()
@@ -102,25 +104,25 @@ class _ObjectDataInput(ObjectDataInput):
         return result
 
     def read_boolean_array(self):
-        return self._read_array_fnc(self.read_boolean)
+        return self._read_primitive_array("?", BOOLEAN_SIZE_IN_BYTES)
 
     def read_char_array(self):
         return self._read_array_fnc(self.read_char)
 
     def read_int_array(self):
-        return self._read_array_fnc(self.read_int)
+        return self._read_primitive_array("i", INT_SIZE_IN_BYTES)
 
     def read_long_array(self):
-        return self._read_array_fnc(self.read_long)
+        return self._read_primitive_array("q", LONG_SIZE_IN_BYTES)
 
     def read_double_array(self):
-        return self._read_array_fnc(self.read_double)
+        return self._read_primitive_array("d", DOUBLE_SIZE_IN_BYTES)
 
     def read_float_array(self):
-        return self._read_array_fnc(self.read_float)
+        return self._read_primitive_array("f", FLOAT_SIZE_IN_BYTES)
 
     def read_short_array(self):
-        return self._read_array_fnc(self.read_short)
+        return self._read_primitive_array("h", SHORT_SIZE_IN_BYTES)
 
     def read_string_array(self):
         return self._read_array_fnc(self.read_string)
@@ -145,11 +147,8 @@ class _ObjectDataInput(ObjectDataInput):
             return "BIG_ENDIAN"
         return "LITTLE_ENDIAN"
 
-    def read_utf(self):
-        return self.read_string()
-
-    def read_utf_array(self):
-        return self.read_string_array()
+    read_utf = read_string
+    read_utf_array = read_string_array
 
     # HELPERS
     def _check_available(self, position, size):
@@ -160,12 +159,17 @@ class _ObjectDataInput(ObjectDataInput):
             raise EOFError("Cannot read %s bytes!" % size)
 
     def _read_from_buff(self, fmt, size, position=None):
+        # Bounds are checked here rather than with a separate
+        # _check_available call, as this is the hottest read path
+        pos = self._pos if position is None else position
+        if pos < 0:
+            raise ValueError
+        if self._size - pos < size:
+            raise EOFError("Cannot read %s bytes!" % size)
+        val = fmt.unpack_from(self._buffer, pos)[0]
         if position is None:
-            val = fmt.unpack_from(self._buffer, self._pos)
-            self._pos += size
-        else:
-            val = fmt.unpack_from(self._buffer, position)
-        return val[0]
+            self._pos = pos + size
+        return val
 
     def _read_array_fnc(self, read_item_fnc):
         length = self.read_int()
@@ -175,6 +179,22 @@ class _ObjectDataInput(ObjectDataInput):
             return [read_item_fnc() for _ in range(0, length)]
         return []
 
+    def _read_primitive_array(self, type_code, item_size):
+        # Unpacks all the items with a single struct call
+        # instead of reading them one by one
+        length = self.read_int()
+        if length == NULL_ARRAY_LENGTH:
+            return None
+        if length > 0:
+            size = length * item_size
+            self._check_available(self._pos, size)
+            values = struct.unpack_from(
+                "%s%d%s" % (self._BYTE_ORDER, length, type_code), self._buffer, self._pos
+            )
+            self._pos += size
+            return list(values)
+        return []
+
     def __repr__(self):
         from binascii import hexlify
 
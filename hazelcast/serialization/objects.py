@@ -66,6 +66,8 @@ class IdentifiedAddress(Address, IdentifiedDataSerializable):
         # skip type as it is unused in the Python client
         object_data_input.read_byte()
         self.host = object_data_input.read_string()
+        # The hash is cached on construction, before the fields are read
+        self._hash = hash((self.host, self.port))
 
     def get_factory_id(self):
         return self.FACTORY_ID
@@ -1,3 +1,5 @@
+import struct
+
 from hazelcast.serialization.api import *
 from hazelcast.serialization.bits import *
 
@@ -16,6 +18,7 @@ class _ObjectDataOutput(ObjectDataOutput):
         self._FMT_LONG = BE_LONG if self._is_big_endian else LE_LONG
         self._FMT_FLOAT = BE_FLOAT if self._is_big_endian else LE_FLOAT
         self._FMT_DOUBLE = BE_DOUBLE if self._is_big_endian else LE_DOUBLE
+        self._BYTE_ORDER = ">" if self._is_big_endian else "<"
 
     def _write(self, val):
         self._ensure_available(BYTE_SIZE_IN_BYTES)
@@ -23,13 +26,23 @@ class _ObjectDataOutput(ObjectDataOutput):
         self._pos += BYTE_SIZE_IN_BYTES
 
     def write_from(self, buff, offset=None, length=None):
+        if not isinstance(buff, (bytes, bytearray)):
+            try:
+                # Offset and length are in bytes, whatever the item size is
+                buff = memoryview(buff).cast("B")
+            except TypeError:
+                # Not a buffer, but a sequence of byte values
+                buff = bytearray(buff)
         _off = offset if offset is not None else 0
         _len = length if length is not None else len(buff)
         if _off < 0 or _len < 0 or (_off + _len) > len(buff):
             raise IndexError()
-        elif length == 0:
+        elif _len == 0:
             return
         self._ensure_available(_len)
+        if _off != 0 or _len != len(buff):
+            # Slicing a memoryview does not copy the data
+            buff = memoryview(buff)[_off : _off + _len]
         self._buffer[self._pos : self._pos + _len] = buff
         self._pos += _len
 
@@ -80,9 +93,16 @@ class _ObjectDataOutput(ObjectDataOutput):
         if val is None:
             self.write_int(NULL_ARRAY_LENGTH)
         else:
+            # Length and content are written with a single capacity
+            # check, skipping the write_int and write_from calls
             encoded_data = val.encode("utf-8")
-            self.write_int(len(encoded_data))
-            self.write_from(encoded_data)
+            length = len(encoded_data)
+            self._ensure_available(INT_SIZE_IN_BYTES + length)
+            pos = self._pos
+            self._FMT_INT.pack_into(self._buffer, pos, length)
+            pos += INT_SIZE_IN_BYTES
+            self._buffer[pos : pos + length] = encoded_data
+            self._pos = pos + length
 
     def write_bytes(self, val):
         n = len(val)
@@ -103,25 +123,25 @@ class _ObjectDataOutput(ObjectDataOutput):
             self.write_from(val)
 
     def write_boolean_array(self, val):
-        self._write_array_fnc(val, self.write_boolean)
+        self._write_primitive_array(val, "?", BOOLEAN_SIZE_IN_BYTES)
 
     def write_char_array(self, val):
         self._write_array_fnc(val, self.write_char)
 
     def write_int_array(self, val):
-        self._write_array_fnc(val, self.write_int)
+        self._write_primitive_array(val, "i", INT_SIZE_IN_BYTES)
 
     def write_long_array(self, val):
-        self._write_array_fnc(val, self.write_long)
+        self._write_primitive_array(val, "q", LONG_SIZE_IN_BYTES)
 
     def write_double_array(self, val):
-        self._write_array_fnc(val, self.write_double)
+        self._write_primitive_array(val, "d", DOUBLE_SIZE_IN_BYTES)
 
     def write_float_array(self, val):
-        self._write_array_fnc(val, self.write_float)
+        self._write_primitive_array(val, "f", FLOAT_SIZE_IN_BYTES)
 
     def write_short_array(self, val):
-        self._write_array_fnc(val, self.write_short)
+        self._write_primitive_array(val, "h", SHORT_SIZE_IN_BYTES)
 
     def write_string_array(self, val):
         self._write_array_fnc(val, self.write_string)
@@ -150,11 +170,8 @@ class _ObjectDataOutput(ObjectDataOutput):
         for _ in range(0, count):
             self._write(0)
 
-    def write_utf(self, val):
-        self.write_string(val)
-
-    def write_utf_array(self, val):
-        self.write_string_array(val)
+    write_utf = write_string
+    write_utf_array = write_string_array
 
     # HELPERS
     def _write_array_fnc(self, val, item_write_fnc):
@@ -164,13 +181,26 @@ class _ObjectDataOutput(ObjectDataOutput):
             for item in val:
                 item_write_fnc(item)
 
+    def _write_primitive_array(self, val, type_code, item_size):
+        # Packs all the items with a single struct call
+        # instead of writing them one by one
+        _len = len(val) if val is not None else NULL_ARRAY_LENGTH
+        self.write_int(_len)
+        if _len > 0:
+            size = _len * item_size
+            self._ensure_available(size)
+            struct.pack_into(
+                "%s%d%s" % (self._BYTE_ORDER, _len, type_code), self._buffer, self._pos, *val
+            )
+            self._pos += size
+
     def _ensure_available(self, length):
         if self._available() < length:
             buffer_length = len(self._buffer)
             new_length = max(buffer_length << 1, buffer_length + length)
-            new_buffer = bytearray(new_length)
-            new_buffer[: self._pos] = self._buffer[: self._pos]
-            self._buffer = new_buffer
+            # Grow in place, instead of allocating a new buffer and
+            # copying the written part through a temporary slice
+            self._buffer.extend(bytes(new_length - buffer_length))
 
     def _available(self):
         return len(self._buffer) - self._pos
@@ -218,11 +218,8 @@ class DefaultPortableReader(PortableReader):
         finally:
             self._in.set_position(current_pos)
 
-    def read_utf(self, field_name):
-        return self.read_string(field_name)
-
-    def read_utf_array(self, field_name):
-        return self.read_string_array(field_name)
+    read_utf = read_string
+    read_utf_array = read_string_array
 
     def get_raw_data_input(self):
         if not self._raw:
@@ -241,7 +238,9 @@ class DefaultPortableReader(PortableReader):
             raise HazelcastSerializationError(
                 "Cannot read Portable fields after get_raw_data_input() is called!"
             )
-        fd = self._class_def.get_field(field_name)
+        # Field definitions are already indexed by name, look them up
+        # directly instead of going through get_field's int/str dispatch
+        fd = self._class_def.field_defs.get(field_name, None)
         if fd is None:
             return self._read_nested_position(field_name, field_type)
         if fd.field_type != field_type:
@@ -483,11 +482,8 @@ class MorphingPortableReader(DefaultPortableReader):
         self.validate_type_compatibility(fd, FieldType.PORTABLE_ARRAY)
         return super(MorphingPortableReader, self).read_portable_array(field_name)
 
-    def read_utf(self, field_name):
-        return self.read_string(field_name)
-
-    def read_utf_array(self, field_name):
-        return self.read_string_array(field_name)
+    read_utf = read_string
+    read_utf_array = read_string_array
 
     def validate_type_compatibility(self, field_def, expected_type):
         if field_def.field_type != expected_type:
@@ -139,11 +139,8 @@ class DefaultPortableWriter(PortableWriter):
         self._raw = True
         return self._out
 
-    def write_utf(self, field_name, value):
-        self.write_string(field_name, value)
-
-    def write_utf_array(self, field_name, values):
-        self.write_string_array(field_name, values)
+    write_utf = write_string
+    write_utf_array = write_string_array
 
     # internal
     def _set_position(self, field_name, field_type):
@@ -300,11 +297,8 @@ class ClassDefinitionWriter(PortableWriter):
     def get_raw_data_output(self):
         return EmptyObjectDataOutput()
 
-    def write_utf(self, field_name, value):
-        self.write_string(field_name, value)
-
-    def write_utf_array(self, field_name, values):
-        self.write_string_array(field_name, values)
+    write_utf = write_string
+    write_utf_array = write_string_array
 
     def _create_nested_class_def(self, portable, nested_builder):
         _writer = ClassDefinitionWriter(self.portable_context, class_def_builder=nested_builder)
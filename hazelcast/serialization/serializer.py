@@ -312,8 +312,10 @@ class ArrayListSerializer(BaseSerializer):
     def write(self, out, obj):
         size = NULL_ARRAY_LENGTH if obj is None else len(obj)
         out.write_int(size)
-        for i in range(0, size):
-            out.write_object(obj[i])
+        if size > 0:
+            write_object = out.write_object
+            for item in obj:
+                write_object(item)
 
     def get_type_id(self):
         return JAVA_DEFAULT_TYPE_ARRAY_LIST
@@ -54,7 +54,9 @@ def current_time_in_millis():
 
 
 def thread_id():
-    return threading.currentThread().ident
+    # Same value as current_thread().ident, without
+    # looking up the Thread object on every call.
+    return threading.get_ident()
 
 
 def to_millis(seconds):
@@ -81,7 +83,7 @@ class AtomicInteger:
     """An Integer which can work atomically."""
 
     def __init__(self, initial: int = 0):
-        self._mux = threading.RLock()
+        self._mux = threading.Lock()
         self._counter = initial
 
     def get_and_increment(self) -> int:
@@ -23,3 +23,44 @@ class AddressHelperTest(unittest.TestCase):
                 address = secondaries[i - 1]
             self.assertEqual(host, address.host)
             self.assertEqual(self.default_port + i, address.port)
+
+    def _validate_with_port(self, address, host, port):
+        primaries, secondaries = AddressHelper.get_possible_addresses(address)
+        self.assertEqual(1, len(primaries))
+        self.assertEqual(0, len(secondaries))
+
+        address = primaries[0]
+        self.assertEqual(host, address.host)
+        self.assertEqual(port, address.port)
+
+    def test_v4_address_without_port(self):
+        self._validate_without_port(self.v4_address, self.v4_address)
+
+    def test_v4_address_with_port(self):
+        self._validate_with_port(self.v4_address + ":" + str(self.port), self.v4_address, self.port)
+
+    def test_v6_address_without_port(self):
+        self._validate_without_port(self.v6_address, self.v6_address)
+
+    def test_v6_address_without_port_with_brackets(self):
+        self._validate_without_port("[" + self.v6_address + "]", self.v6_address)
+
+    def test_v6_address_with_port(self):
+        self._validate_with_port(
+            "[" + self.v6_address + "]:" + str(self.port), self.v6_address, self.port
+        )
+
+    def test_localhost_without_port(self):
+        self._validate_without_port(self.localhost, self.localhost)
+
+    def test_localhost_with_port(self):
+        self._validate_with_port(self.localhost + ":" + str(self.port), self.localhost, self.port)
+
+    def test_address_from_str_with_default_port(self):
+        address = AddressHelper.address_from_str(self.localhost, self.port)
+        self.assertEqual(self.localhost, address.host)
+        self.assertEqual(self.port, address.port)
+
+    def test_address_from_str_with_invalid_port(self):
+        with self.assertRaises(ValueError):
+            AddressHelper.address_from_str(self.localhost + ":port")
@@ -41,6 +41,15 @@ class OutboundMessageTest(unittest.TestCase):
         self.assertEqual(42, message.get_correlation_id())
         self.assertEqual(23, partition_id)
 
+    def test_correlation_and_partition_id(self):
+        buf = bytearray(22)
+        message = OutboundMessage(buf, False)
+        message.set_correlation_and_partition_id(42, 23)
+
+        partition_id = LE_INT.unpack_from(message.buf, 6 + 4 + 8)[0]
+        self.assertEqual(42, message.get_correlation_id())
+        self.assertEqual(23, partition_id)
+
     def test_copy(self):
         buf = bytearray(range(20))
         message = OutboundMessage(buf, True)
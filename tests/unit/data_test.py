@@ -23,5 +23,11 @@ class DataTestCase(unittest.TestCase):
         self.assertEqual(1545424565, self._data.hash_code())
         self.assertEqual(0x12345678, self._data.get_partition_hash())
 
+    def test_partition_hash_without_partitioning_hash(self):
+        data = Data(binascii.unhexlify("00000000" + "01020304" + "12345678"))
+        self.assertEqual(data.hash_code(), data.get_partition_hash())
+        # Subsequent calls return the computed hash
+        self.assertEqual(data.hash_code(), data.get_partition_hash())
+
     def test_data_len(self):
         self.assertEqual(10, len(Data("1" * 10)))
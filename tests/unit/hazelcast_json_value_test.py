@@ -1,4 +1,5 @@
 import json
+import math
 import unittest
 
 from hazelcast.core import HazelcastJsonValue
@@ -33,3 +34,14 @@ class HazelcastJsonValueTest(unittest.TestCase):
     def test_hazelcast_json_value_loads(self):
         json_value = HazelcastJsonValue(self.json_str)
         self.assertEqual(self.json_obj, json_value.loads())
+
+    def test_hazelcast_json_value_loads_with_non_finite_floats(self):
+        json_value = HazelcastJsonValue({"a": float("nan"), "b": float("inf")})
+        obj = json_value.loads()
+        self.assertTrue(math.isnan(obj["a"]))
+        self.assertEqual(float("inf"), obj["b"])
+
+    def test_hazelcast_json_value_loads_with_invalid_string(self):
+        json_value = HazelcastJsonValue("{invalid")
+        with self.assertRaises(ValueError):
+            json_value.loads()
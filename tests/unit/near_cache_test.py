@@ -151,6 +151,37 @@ class NearCacheTestCase(unittest.TestCase):
         self.assertEqual(expire, 0)
         self.assertGreaterEqual(evict, 100)
 
+    def test_invalidate_many(self):
+        near_cache = self.create_near_cache(
+            self.service, InMemoryFormat.OBJECT, 1000, 1000, EvictionPolicy.LRU, 100
+        )
+        for i in range(0, 10):
+            near_cache["key-{}".format(i)] = "value-{}".format(i)
+
+        near_cache._invalidate_many(["key-0", "key-1", "key-10"])
+
+        self.assertEqual(8, len(near_cache))
+        self.assertNotIn("key-0", near_cache)
+        self.assertNotIn("key-1", near_cache)
+        stats = near_cache.get_statistics()
+        self.assertEqual(2, stats["invalidations"])
+        self.assertEqual(3, stats["invalidation_requests"])
+
+    def test_get_many(self):
+        near_cache = self.create_near_cache(
+            self.service, InMemoryFormat.OBJECT, 1000, 1000, EvictionPolicy.LRU, 100
+        )
+        near_cache["key-0"] = "value-0"
+        near_cache["key-1"] = None
+        missing = object()
+
+        values = near_cache._get_many(["key-0", "key-1", "key-2"], missing)
+
+        self.assertEqual(["value-0", None, missing], values)
+        stats = near_cache.get_statistics()
+        self.assertEqual(2, stats["hits"])
+        self.assertEqual(1, stats["misses"])
+
     def create_near_cache(
         self,
         service,
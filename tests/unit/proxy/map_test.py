@@ -0,0 +1,617 @@
+import threading
+import types
+import unittest
+
+from mock import MagicMock, patch
+
+from hazelcast.config import _Config
+from hazelcast.errors import HazelcastClientNotActiveError
+from hazelcast.future import Future
+from hazelcast.invocation import InvocationService
+from hazelcast.near_cache import NearCacheManager
+from hazelcast.protocol.client_message import (
+    Frame,
+    InboundMessage,
+    RESPONSE_HEADER_SIZE,
+    SIZE_OF_FRAME_LENGTH_AND_FLAGS,
+)
+from hazelcast.protocol.codec import (
+    client_destroy_proxy_codec,
+    map_contains_key_codec,
+    map_contains_value_codec,
+    map_delete_codec,
+    map_get_codec,
+    map_is_empty_codec,
+    map_put_all_codec,
+    map_put_codec,
+    map_remove_codec,
+    map_set_codec,
+    map_size_codec,
+)
+from hazelcast.proxy import MAP_SERVICE, ProxyManager
+from hazelcast.proxy.map import (
+    Map,
+    create_map_proxy,
+    _PutCoalescer,
+    _KEY_DATA_CACHE_MAX_STR_LENGTH,
+    _KeyRequestEncoder,
+)
+from hazelcast.partition import _InternalPartitionService
+from hazelcast.predicate import sql
+from hazelcast.reactor import AsyncoreReactor
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.serialization.bits import INT_SIZE_IN_BYTES, LE_INT, LE_LONG
+from hazelcast.util import ImmutableLazyDataList
+
+
+def mock_codec(name):
+    # Patches the codec with the given name in the map module
+    return patch("hazelcast.proxy.map.%s" % name)
+
+
+MAX_DELAY = 0.001
+MAX_BATCH = 10
+
+
+class PutCoalescerTest(unittest.TestCase):
+    def setUp(self):
+        self.map = MagicMock()
+        self.map.name = "map"
+        # Keys are partitioned by their value
+        self.map._partition_service.get_partition_id.side_effect = lambda key: key % 3
+        self.invocations = {}
+        self.map._invoke_on_partition.side_effect = self._invoke_on_partition
+        self.reactor = MagicMock()
+        self.coalescer = _PutCoalescer(self.map, self.reactor)
+
+    def _invoke_on_partition(self, request, partition_id):
+        future = Future()
+        self.invocations[partition_id] = future
+        return future
+
+    def _put(self, key, value=None, max_delay=MAX_DELAY, max_batch=MAX_BATCH):
+        # The put all codec is mocked, so plain
+        # objects are used instead of the Data.
+        return self.coalescer.put(key, value, max_delay, max_batch)
+
+    def _timer_callback(self):
+        self.reactor.add_timer.assert_called_once()
+        return self.reactor.add_timer.call_args[0][1]
+
+    def test_timer_triggered_flush(self):
+        with mock_codec("map_put_all_codec") as codec:
+            futures = [self._put(i) for i in range(4)]
+            self.assertEqual(0, len(self.invocations))
+
+            self._timer_callback()()
+
+            self.assertEqual({0, 1, 2}, set(self.invocations))
+            self.assertEqual(3, codec.encode_request.call_count)
+            for future in self.invocations.values():
+                future.set_result(None)
+
+        for future in futures:
+            self.assertTrue(future.done())
+            self.assertIsNone(future.result())
+
+    def test_per_partition_grouping(self):
+        with mock_codec("map_put_all_codec") as codec:
+            for i in range(7):
+                self._put(i, "v%d" % i)
+
+            self._timer_callback()()
+
+            entries_by_partition = {}
+            for call in codec.encode_request.call_args_list:
+                name, entries, _ = call[0]
+                self.assertEqual("map", name)
+                entries_by_partition[entries[0][0] % 3] = entries
+
+        self.assertEqual([(0, "v0"), (3, "v3"), (6, "v6")], entries_by_partition[0])
+        self.assertEqual([(1, "v1"), (4, "v4")], entries_by_partition[1])
+        self.assertEqual([(2, "v2"), (5, "v5")], entries_by_partition[2])
+
+    def test_size_triggered_flush(self):
+        with mock_codec("map_put_all_codec"):
+            for _ in range(MAX_BATCH - 1):
+                self._put(0)
+            self.assertEqual(0, len(self.invocations))
+
+            self._put(0)
+            self.assertEqual({0}, set(self.invocations))
+            self.reactor.add_timer.return_value.cancel.assert_called_once()
+
+            # The late timer callback finds the buffer empty
+            self._timer_callback()()
+            self.assertEqual(1, self.map._invoke_on_partition.call_count)
+
+    def test_concurrent_size_and_timer_triggered_flush(self):
+        sending = threading.Event()
+        proceed = threading.Event()
+        sent_entries = []
+
+        def invoke_on_partition(entries, partition_id):
+            if not sending.is_set():
+                # Hold the size-triggered flush in the middle of the send
+                sending.set()
+                proceed.wait(5)
+            sent_entries.append(entries)
+            return Future()
+
+        self.map._invoke_on_partition.side_effect = invoke_on_partition
+
+        def put_and_flush():
+            self._put(0, "late")
+            self.coalescer._flush()
+
+        with mock_codec("map_put_all_codec") as codec:
+            codec.encode_request.side_effect = lambda name, entries, _: entries
+            for _ in range(MAX_BATCH - 1):
+                self._put(0, "early")
+
+            size_flusher = threading.Thread(target=self._put, args=(0, "early"))
+            size_flusher.start()
+            self.assertTrue(sending.wait(5))
+
+            timer_flusher = threading.Thread(target=put_and_flush)
+            timer_flusher.start()
+            # Must not be able to send before the size-triggered flush
+            timer_flusher.join(0.1)
+            proceed.set()
+            size_flusher.join(5)
+            timer_flusher.join(5)
+
+        self.assertEqual(2, len(sent_entries))
+        self.assertEqual([(0, "early")] * MAX_BATCH, sent_entries[0])
+        self.assertEqual([(0, "late")], sent_entries[1])
+
+    def test_invocation_error_propagation(self):
+        with mock_codec("map_put_all_codec"):
+            futures = [self._put(i) for i in range(2)]
+            self._timer_callback()()
+            error = RuntimeError("expected")
+            self.invocations[0].set_exception(error)
+            self.invocations[1].set_result(None)
+
+        self.assertIs(error, futures[0].exception())
+        self.assertIsNone(futures[1].result())
+
+    def test_send_error_propagation(self):
+        error = RuntimeError("expected")
+        self.map._invoke_on_partition.side_effect = error
+        with mock_codec("map_put_all_codec"):
+            futures = [self._put(i) for i in range(2)]
+            # Must not raise, as it runs on the reactor thread
+            self._timer_callback()()
+
+        for future in futures:
+            self.assertTrue(future.done())
+            self.assertIs(error, future.exception())
+
+    def test_shorter_delay_brings_flush_forward(self):
+        timers = [MagicMock(), MagicMock()]
+        self.reactor.add_timer.side_effect = timers
+        with mock_codec("map_put_all_codec"):
+            self._put(0, max_delay=1)
+            # Does not postpone the flush
+            self._put(1, max_delay=2)
+            self.assertEqual(1, self.reactor.add_timer.call_count)
+
+            self._put(2, max_delay=0)
+
+        self.assertEqual(2, self.reactor.add_timer.call_count)
+        self.assertEqual(0, self.reactor.add_timer.call_args[0][0])
+        timers[0].cancel.assert_called_once()
+        timers[1].cancel.assert_not_called()
+
+    def test_max_batch_of_the_entry(self):
+        with mock_codec("map_put_all_codec"):
+            self._put(0, max_batch=3)
+            self._put(0, max_batch=3)
+            self.assertEqual(0, len(self.invocations))
+
+            self._put(0, max_batch=3)
+            self.assertEqual({0}, set(self.invocations))
+
+    def test_shutdown_fails_buffered_entries(self):
+        with mock_codec("map_put_all_codec"):
+            futures = [self._put(i) for i in range(2)]
+            self.coalescer.shutdown()
+
+            # The late timer callback finds the buffer empty
+            self._timer_callback()()
+            futures.append(self._put(0))
+
+        self.assertEqual(0, len(self.invocations))
+        for future in futures:
+            self.assertIsInstance(future.exception(), HazelcastClientNotActiveError)
+
+    def test_futures_completed_outside_lock(self):
+        lock_held = []
+
+        def callback(_):
+            acquired = self.coalescer._lock.acquire(blocking=False)
+            if acquired:
+                self.coalescer._lock.release()
+            lock_held.append(not acquired)
+
+        self.map._invoke_on_partition.side_effect = RuntimeError("expected")
+        with mock_codec("map_put_all_codec"):
+            for _ in range(MAX_BATCH):
+                self._put(0).add_done_callback(callback)
+
+        self.assertEqual([False] * MAX_BATCH, lock_held)
+
+
+class MapPutCoalescedTest(unittest.TestCase):
+    # Runs put_coalesced through the proxy manager and the
+    # invocation service, with a connection that responds
+    # to each request as soon as it is sent.
+
+    def setUp(self):
+        self.reactor = AsyncoreReactor()
+        self.reactor.start()
+        config = _Config()
+        config.near_caches = {"near-cached-map": {"invalidate_on_change": False}}
+        self.invocation_service = InvocationService(MagicMock(), config, self.reactor)
+        connection = MagicMock()
+        connection.send_message.side_effect = self._send_message
+        connection_manager = MagicMock()
+        connection_manager.get_random_connection.return_value = connection
+        partition_service = _InternalPartitionService(None)
+        partition_service.partition_count = 271
+        self.invocation_service.init(partition_service, connection_manager, MagicMock())
+        self.invocation_service.start()
+
+        context = MagicMock()
+        context.config = config
+        context.reactor = self.reactor
+        context.invocation_service = self.invocation_service
+        context.partition_service = partition_service
+        context.serialization_service = SerializationServiceV1(config)
+        context.near_cache_manager = NearCacheManager(config, context.serialization_service)
+        self.proxy_manager = ProxyManager(context)
+        context.proxy_manager = self.proxy_manager
+        self.map = self.proxy_manager.get_or_create(MAP_SERVICE, "my-map", False)
+        self.sent_message_types = []
+        self.release_reactor = threading.Event()
+
+    def tearDown(self):
+        self.release_reactor.set()
+        self.proxy_manager.shutdown()
+        self.invocation_service.shutdown()
+        self.reactor.shutdown()
+
+    def _send_message(self, message):
+        message_type = LE_INT.unpack_from(message.buf, SIZE_OF_FRAME_LENGTH_AND_FLAGS)[0]
+        self.sent_message_types.append(message_type)
+        buf = bytearray(RESPONSE_HEADER_SIZE)
+        LE_INT.pack_into(buf, 0, message_type + 1)
+        LE_LONG.pack_into(buf, INT_SIZE_IN_BYTES, message.get_correlation_id())
+        self.invocation_service.handle_client_message(InboundMessage(Frame(buf, 0)))
+        return True
+
+    def _hold_reactor(self):
+        # Blocks the reactor thread, so that the flush timer cannot fire
+        held = threading.Event()
+
+        def hold():
+            held.set()
+            self.release_reactor.wait(5)
+
+        self.reactor.add_timer(0, hold)
+        self.assertTrue(held.wait(5))
+
+    def test_put_coalesced(self):
+        futures = [self.map.put_coalesced(i, i) for i in range(10)]
+        for future in futures:
+            self.assertIsNone(future.result())
+        self.assertGreater(len(self.sent_message_types), 1)
+        self.assertEqual({map_put_all_codec._REQUEST_MESSAGE_TYPE}, set(self.sent_message_types))
+
+    def test_put_coalesced_with_invalid_arguments(self):
+        with self.assertRaises(AssertionError):
+            self.map.put_coalesced("key", "value", max_delay=-1)
+        with self.assertRaises(AssertionError):
+            self.map.put_coalesced("key", "value", max_batch=0)
+
+    def test_blocking_put_coalesced(self):
+        with self.assertRaises(NotImplementedError):
+            self.map.blocking().put_coalesced("key", "value")
+
+    def test_near_cache_invalidated_after_response(self):
+        near_cached_map = self.proxy_manager.get_or_create(MAP_SERVICE, "near-cached-map", False)
+        near_cache = near_cached_map._near_cache
+        key_data = near_cached_map._to_data("key")
+        self._hold_reactor()
+        future = near_cached_map.put_coalesced("key", "new-value")
+
+        # A get before the entry is sent caches the old value again
+        near_cache[key_data] = "old-value"
+        self.release_reactor.set()
+
+        self.assertIsNone(future.result())
+        self.assertIsNone(near_cache._get(key_data, None))
+
+    def test_destroy_sends_buffered_entries(self):
+        self._hold_reactor()
+        futures = [self.map.put_coalesced(i, i) for i in range(10)]
+        self.assertEqual([], self.sent_message_types)
+
+        self.assertTrue(self.map.destroy())
+        for future in futures:
+            self.assertIsNone(future.result())
+        # Sent before the destroy request
+        self.assertEqual(
+            client_destroy_proxy_codec._REQUEST_MESSAGE_TYPE, self.sent_message_types[-1]
+        )
+
+    def test_shutdown_with_buffered_entries(self):
+        self._hold_reactor()
+        future = self.map.put_coalesced("key", "value")
+
+        # Called by the client on shutdown
+        self.proxy_manager.shutdown()
+
+        self.assertIsInstance(future.exception(), HazelcastClientNotActiveError)
+        with self.assertRaises(HazelcastClientNotActiveError):
+            self.map.put_coalesced("key", "value").result()
+        self.assertEqual([], self.sent_message_types)
+
+
+class MapRequestEncoderTest(unittest.TestCase):
+    # The templated encoders must produce exactly what the codecs produce
+
+    def setUp(self):
+        context = MagicMock()
+        context.config = _Config()
+        context.serialization_service = SerializationServiceV1(context.config)
+        self.map = Map("hz:impl:mapService", "my-map", context)
+        self.key = context.serialization_service.to_data("key")
+        self.value = context.serialization_service.to_data("value")
+
+    def test_key_requests(self):
+        for encoder, codec in (
+            (self.map._encode_get_request, map_get_codec),
+            (self.map._encode_remove_request, map_remove_codec),
+            (self.map._encode_delete_request, map_delete_codec),
+            (self.map._encode_contains_key_request, map_contains_key_codec),
+        ):
+            self.assert_same_request(
+                codec.encode_request("my-map", self.key, 42), encoder(self.key, 42)
+            )
+
+    def test_entry_requests(self):
+        for encoder, codec in (
+            (self.map._encode_put_request, map_put_codec),
+            (self.map._encode_set_request, map_set_codec),
+        ):
+            self.assert_same_request(
+                codec.encode_request("my-map", self.key, self.value, 42, 1234),
+                encoder(self.key, self.value, 42, 1234),
+            )
+
+    def test_value_request(self):
+        self.assert_same_request(
+            map_contains_value_codec.encode_request("my-map", self.value),
+            self.map._encode_contains_value_request(self.value),
+        )
+
+    def test_name_requests(self):
+        self.assert_same_request(
+            map_is_empty_codec.encode_request("my-map"), self.map._encode_is_empty_request()
+        )
+        self.assert_same_request(
+            map_size_codec.encode_request("my-map"), self.map._encode_size_request()
+        )
+
+    def test_template_not_matching_codec(self):
+        codec = types.ModuleType("map_get_codec")
+        codec.encode_request = map_get_codec.encode_request
+        codec._REQUEST_THREAD_ID_OFFSET = map_get_codec._REQUEST_THREAD_ID_OFFSET + 1
+        with self.assertRaises(AssertionError):
+            _KeyRequestEncoder(codec, "my-map")
+
+    def assert_same_request(self, expected, actual):
+        self.assertEqual(expected.buf, actual.buf)
+        self.assertEqual(expected.retryable, actual.retryable)
+
+
+class MapTest(unittest.TestCase):
+    def setUp(self):
+        context = MagicMock()
+        context.config = _Config()
+        context.config.near_caches = {"near-cached-map": {"invalidate_on_change": False}}
+        context.serialization_service = SerializationServiceV1(context.config)
+        context.near_cache_manager = NearCacheManager(context.config, context.serialization_service)
+        partition_service = _InternalPartitionService(None)
+        partition_service.partition_count = 271
+        context.partition_service = partition_service
+        self.invocations = []
+        # Returns the response, or the error, for the request
+        self.respond = lambda request: None
+        context.invocation_service.invoke.side_effect = self._invoke
+        self.map = create_map_proxy(MAP_SERVICE, "my-map", context)
+        self.near_cached_map = create_map_proxy(MAP_SERVICE, "near-cached-map", context)
+
+    def _invoke(self, invocation):
+        self.invocations.append(invocation)
+        response = self.respond(invocation.request)
+        if isinstance(response, Exception):
+            invocation.set_exception(response)
+        else:
+            invocation.set_response(response)
+
+    def test_put_all_to_single_partition(self):
+        self.assertIsNone(self.map.put_all({"a": 1}).result())
+        self.assertEqual(1, len(self.invocations))
+
+    def test_put_all_to_multiple_partitions(self):
+        self.assertIsNone(self.map.put_all({str(i): i for i in range(10)}).result())
+        self.assertGreater(len(self.invocations), 1)
+
+    def test_put_all_empty(self):
+        self.assertIsNone(self.map.put_all({}).result())
+        self.assertEqual(0, len(self.invocations))
+
+    def test_eager_entry_set(self):
+        entries = self._mock_entry_list_codecs()
+        for predicate in (None, sql("this > 0")):
+            self.assert_eager(entries, self.map.entry_set(predicate, eager=True).result())
+            self.assert_eager(entries, self.map.blocking().entry_set(predicate, eager=True))
+
+    def test_eager_key_set(self):
+        keys = [key for key, _ in self._mock_entry_list_codecs()]
+        for predicate in (None, sql("this > 0")):
+            self.assert_eager(keys, self.map.key_set(predicate, eager=True).result())
+            self.assert_eager(keys, self.map.blocking().key_set(predicate, eager=True))
+
+    def test_eager_values(self):
+        values = [value for _, value in self._mock_entry_list_codecs()]
+        for predicate in (None, sql("this > 0")):
+            self.assert_eager(values, self.map.values(predicate, eager=True).result())
+            self.assert_eager(values, self.map.blocking().values(predicate, eager=True))
+
+    def test_lazy_by_default(self):
+        self._mock_entry_list_codecs()
+        self.assertIsInstance(self.map.entry_set().result(), ImmutableLazyDataList)
+        self.assertIsInstance(self.map.key_set(sql("this > 0")).result(), ImmutableLazyDataList)
+        self.assertIsInstance(self.map.blocking().values(), ImmutableLazyDataList)
+
+    def test_str_and_int_keys_cached(self):
+        key_data = self.map._key_to_data("key")
+        self.assertIs(key_data, self.map._key_to_data("key"))
+        key_data = self.map._key_to_data(1)
+        self.assertIs(key_data, self.map._key_to_data(1))
+
+    def test_equal_keys_of_other_types_not_served_from_cache(self):
+        to_data = self.map._to_data
+        self.map._key_to_data(1)
+        self.map._key_to_data("key")
+        self.assertEqual(to_data(True), self.map._key_to_data(True))
+        self.assertNotEqual(to_data(1), self.map._key_to_data(True))
+        self.assertEqual(to_data(StrSubclass("key")), self.map._key_to_data(StrSubclass("key")))
+        self.assertEqual(2, self.map._cached_key_to_data.cache_info().currsize)
+
+    def test_long_str_keys_not_cached(self):
+        key = "k" * (_KEY_DATA_CACHE_MAX_STR_LENGTH + 1)
+        self.assertEqual(self.map._to_data(key), self.map._key_to_data(key))
+        self.assertEqual(0, self.map._cached_key_to_data.cache_info().currsize)
+
+    def test_get_all_with_keys_not_comparable_to_none(self):
+        keys = [KeyComparedByAttribute(i) for i in range(3)]
+        self._mock_get_all_codec()
+        self.assertEqual({key: key for key in keys}, self.map.get_all(keys).result())
+
+    def test_get_all_with_key_generator(self):
+        self._mock_get_all_codec()
+        result = self.map.get_all(str(i) for i in range(3)).result()
+        self.assertEqual({"0": "0", "1": "1", "2": "2"}, result)
+
+    def test_get_all_from_multiple_partitions(self):
+        self._mock_get_all_codec()
+        keys = [str(i) for i in range(20)]
+        self.assertEqual({key: key for key in keys}, self.map.get_all(keys).result())
+        self.assertGreater(len(self.invocations), 1)
+
+    def test_get_all_with_failing_partition(self):
+        self._mock_get_all_codec()
+        failing_key_data = self.map._to_data("3")
+        error = RuntimeError("expected")
+        self.respond = lambda request: error if failing_key_data in request else request
+        future = self.map.get_all([str(i) for i in range(20)])
+        self.assertGreater(len(self.invocations), 1)
+        self.assertIs(error, future.exception())
+
+    def test_get_all_empty(self):
+        self.assertEqual({}, self.map.get_all([]).result())
+        # All the keys might be found locally, as in the near cache
+        self.assertEqual({"a": 1}, self.map._get_all_internal({}, {"a": 1}).result())
+        self.assertEqual(0, len(self.invocations))
+
+    def test_execute_on_keys_with_keys_not_comparable_to_none(self):
+        keys = [KeyComparedByAttribute(i) for i in range(3)]
+        self.assertEqual(keys, self._execute_on_keys(keys))
+
+    def test_execute_on_keys_with_key_generator(self):
+        self.assertEqual(["0", "1", "2"], self._execute_on_keys(str(i) for i in range(3)))
+
+    def test_none_key(self):
+        with self.assertRaises(AssertionError):
+            self.map.get_all([KeyComparedByAttribute(0), None])
+        with self.assertRaises(AssertionError):
+            self.map.execute_on_keys(iter(["key", None]), "processor")
+        self.assertEqual(0, len(self.invocations))
+
+    def test_contains_key_found_in_near_cache(self):
+        near_cached_map = self.near_cached_map
+        near_cached_map._near_cache[near_cached_map._to_data("key")] = "value"
+        future = near_cached_map.contains_key("key")
+        self.assertTrue(future.result())
+        self.assertEqual(0, len(self.invocations))
+
+    def test_contains_key_not_found_in_near_cache(self):
+        with mock_codec("map_contains_key_codec") as codec:
+            codec.decode_response.return_value = False
+            self.assertFalse(self.near_cached_map.contains_key("key").result())
+        self.assertEqual(1, len(self.invocations))
+
+    def _mock_get_all_codec(self):
+        # Each key is mapped to itself, as the request is the key data list
+        patcher = mock_codec("map_get_all_codec")
+        codec = patcher.start()
+        self.addCleanup(patcher.stop)
+        codec.encode_request.side_effect = lambda name, key_list: list(key_list)
+        codec.decode_response.side_effect = lambda message: [(k, k) for k in message]
+        self.respond = lambda request: request
+
+    def _execute_on_keys(self, keys):
+        # Returns the keys sent with the execute on keys request
+        with mock_codec("map_execute_on_keys_codec") as codec:
+            self.map.execute_on_keys(keys, "processor")
+            _, _, key_list = codec.encode_request.call_args[0]
+        self.assertEqual(1, len(self.invocations))
+        return [self.map._to_object(key_data) for key_data in key_list]
+
+    def _mock_entry_list_codecs(self):
+        # Mocks the codecs of entry_set, key_set and values
+        # to decode the same entries, and returns them
+        to_data = self.map._to_data
+        entries = [("k%d" % i, "v%d" % i) for i in range(3)]
+        entry_data_list = [(to_data(key), to_data(value)) for key, value in entries]
+        key_data_list = [key_data for key_data, _ in entry_data_list]
+        value_data_list = [value_data for _, value_data in entry_data_list]
+        for name, response in (
+            ("map_entry_set_codec", entry_data_list),
+            ("map_entries_with_predicate_codec", entry_data_list),
+            ("map_key_set_codec", key_data_list),
+            ("map_key_set_with_predicate_codec", key_data_list),
+            ("map_values_codec", value_data_list),
+            ("map_values_with_predicate_codec", value_data_list),
+        ):
+            patcher = mock_codec(name)
+            patcher.start().decode_response.return_value = response
+            self.addCleanup(patcher.stop)
+        return entries
+
+    def assert_eager(self, expected, actual):
+        # A plain list, with all the items already deserialized
+        self.assertIs(list, type(actual))
+        self.assertEqual(expected, actual)
+
+
+class StrSubclass(str):
+    pass
+
+
+class KeyComparedByAttribute:
+    # Comparing it with anything but another key fails
+
+    def __init__(self, a):
+        self.a = a
+
+    def __eq__(self, other):
+        return self.a == other.a
+
+    def __hash__(self):
+        return hash(self.a)
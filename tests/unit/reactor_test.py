@@ -4,7 +4,7 @@ import threading
 import unittest
 from collections import OrderedDict
 
-from mock import MagicMock
+from mock import MagicMock, patch
 from parameterized import parameterized
 
 from hazelcast.config import _Config
@@ -12,6 +12,7 @@ from hazelcast.core import Address
 from hazelcast.reactor import (
     AsyncoreReactor,
     _WakeableLoop,
+    _WAKEABLE_LOOP_POLL_TIMEOUT,
     _SocketedWaker,
     _PipedWaker,
     _BasicLoop,
@@ -62,6 +63,33 @@ class LoopTest(HazelcastTestCase):
             loop.waker.close()
 
 
+class WakeableLoopTimerTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = _WakeableLoop({})
+        self.loop.waker.close()
+        self.loop.waker = MagicMock()
+
+    def test_short_timer_wakes_loop(self):
+        self.loop.add_timer(_WAKEABLE_LOOP_POLL_TIMEOUT * 10, lambda: None)
+        self.loop.waker.wake.assert_not_called()
+        self.loop.add_timer(_WAKEABLE_LOOP_POLL_TIMEOUT / 10, lambda: None)
+        self.loop.waker.wake.assert_called_once()
+
+    def test_poll_timeout_bounded_by_earliest_timer(self):
+        self.loop.add_timer(_WAKEABLE_LOOP_POLL_TIMEOUT * 10, lambda: None)
+        self.loop._check_timers()
+        self.assertEqual(_WAKEABLE_LOOP_POLL_TIMEOUT, self._poll_timeout())
+
+        self.loop.add_timer(_WAKEABLE_LOOP_POLL_TIMEOUT / 10, lambda: None)
+        self.loop._check_timers()
+        self.assertLessEqual(self._poll_timeout(), _WAKEABLE_LOOP_POLL_TIMEOUT / 10)
+
+    def _poll_timeout(self):
+        with patch("hazelcast.reactor.asyncore.loop") as loop:
+            self.loop.run_loop()
+        return loop.call_args[1]["timeout"]
+
+
 class SocketedWakerTest(unittest.TestCase):
     def setUp(self):
         self.waker = _SocketedWaker({})
@@ -34,6 +34,18 @@ class InputTestCase(unittest.TestCase):
         self.assertEqual(0, initial_pos)
         self.assertEqual(self.INT_ARR, read_arr)
 
+    def test_long_array_le(self):
+        buff = bytearray(binascii.unhexlify("020000000100000000000000feffffffffffffff"))
+        _input = _ObjectDataInput(buff, 0, None, False)
+        self.assertEqual([1, -2], _input.read_long_array())
+        self.assertEqual(len(buff), _input.position())
+
+    def test_truncated_array(self):
+        buff = bytearray(binascii.unhexlify("000000040000000100000002"))
+        _input = _ObjectDataInput(buff, 0, None, True)
+        with self.assertRaises(EOFError):
+            _input.read_int_array()
+
     def test_char_be(self):
         buff = bytearray(binascii.unhexlify("00e70000"))
         _input = _ObjectDataInput(buff, 0, None, True)
@@ -68,3 +80,27 @@ class InputTestCase(unittest.TestCase):
         self.assertEqual(0, inp.position())
         self.assertEqual(0, inp.skip_bytes(-1))
         self.assertEqual(0, inp.position())
+
+    def test_truncated_string(self):
+        buff = bytearray(binascii.unhexlify("0000000a6869"))
+        _input = _ObjectDataInput(buff, 0, None, True)
+        with self.assertRaises(EOFError):
+            _input.read_string()
+
+    def test_read_past_end_at_position(self):
+        buff = bytearray(binascii.unhexlify("0000000100000002"))
+        _input = _ObjectDataInput(buff, 0, None, True)
+        self.assertEqual(2, _input.read_int(4))
+        self.assertEqual(0, _input.position())
+        with self.assertRaises(EOFError):
+            _input.read_long(4)
+
+    def test_read_into(self):
+        buff = bytearray(binascii.unhexlify("0102030405"))
+        _input = _ObjectDataInput(buff, 0, None, True)
+        out = bytearray(4)
+        self.assertEqual(2, _input.read_into(out, 1, 2))
+        self.assertEqual(bytearray(binascii.unhexlify("00010200")), out)
+        self.assertEqual(3, _input.read_into(out))
+        self.assertEqual(bytearray(binascii.unhexlify("03040500")), out)
+        self.assertEqual(5, _input.position())
@@ -1,3 +1,4 @@
+import array
 import binascii
 import unittest
 
@@ -40,3 +41,49 @@ class OutputTestCase(unittest.TestCase):
             bytearray(binascii.unhexlify("00e70000000000000000")),
             self._output._buffer[pos : pos + 10],
         )
+
+    def test_long_array_little_endian(self):
+        output = _ObjectDataOutput(100, None, False)
+        output.write_long_array([1, -2])
+        self.assertEqual(
+            bytearray(binascii.unhexlify("020000000100000000000000feffffffffffffff")),
+            output.to_byte_array(),
+        )
+
+    def test_none_array(self):
+        self._output.write_double_array(None)
+        self.assertEqual(bytearray(binascii.unhexlify("ffffffff")), self._output.to_byte_array())
+
+    def test_array_grows_buffer(self):
+        output = _ObjectDataOutput(4, None, True)
+        output.write_short_array([1, 2, 3])
+        self.assertEqual(
+            bytearray(binascii.unhexlify("00000003000100020003")), output.to_byte_array()
+        )
+
+    def test_write_from_with_offset_and_length(self):
+        self._output.write_from(b"\x01\x02\x03\x04", 1, 2)
+        self.assertEqual(bytearray(b"\x02\x03"), self._output.to_byte_array())
+        self.assertEqual(100, len(self._output._buffer))
+
+    def test_write_from_memoryview(self):
+        self._output.write_from(memoryview(bytearray(b"\x01\x02\x03")))
+        self.assertEqual(bytearray(b"\x01\x02\x03"), self._output.to_byte_array())
+
+    def test_write_from_multi_byte_items(self):
+        doubles = array.array("d", [1.0, 2.0])
+        self._output.write_from(doubles)
+        self._output.write_from(doubles, 8, 8)
+        self._output.write_byte(1)
+        self.assertEqual(
+            bytearray(doubles.tobytes() + doubles.tobytes()[8:] + b"\x01"),
+            self._output.to_byte_array(),
+        )
+        self.assertEqual(100, len(self._output._buffer))
+
+    def test_byte_array_from_list(self):
+        self._output.write_byte_array([1, 2, 3])
+        self._output.write_from([4, 5, 6], 1, 1)
+        self.assertEqual(
+            bytearray(b"\x00\x00\x00\x03\x01\x02\x03\x05"), self._output.to_byte_array()
+        )
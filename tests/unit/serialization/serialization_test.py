@@ -1,11 +1,50 @@
+import os
+import pickle
+import subprocess
+import sys
 import unittest
+import uuid
 
 from hazelcast.config import _Config
-from hazelcast.core import Address
+from hazelcast.core import (
+    Address,
+    DistributedObjectEvent,
+    DistributedObjectInfo,
+    HazelcastJsonValue,
+    SimpleEntryView,
+)
+from hazelcast.serialization.api import IdentifiedDataSerializable
 from hazelcast.serialization.data import Data
 from hazelcast.serialization.service import SerializationServiceV1
 
 
+# Creates core values with cached hashes. Run in another process
+# to pickle them there, where the hashes of strings differ.
+_CREATE_CORE_VALUES = """
+import uuid
+from hazelcast.core import *
+
+qualifier = EndpointQualifier(1, "wan")
+member = MemberInfo(
+    Address("localhost", 5701),
+    uuid.UUID(int=1),
+    {"a": "b"},
+    False,
+    MemberVersion(5, 0, 0),
+    None,
+    {qualifier: Address("localhost", 5702)},
+)
+hash(member)
+values = [
+    qualifier,
+    member,
+    Address("localhost", 5701),
+    DistributedObjectInfo("service", "name"),
+    HazelcastJsonValue('{"a": 1}'),
+]
+"""
+
+
 class SerializationTestCase(unittest.TestCase):
     def setUp(self):
         self.service = SerializationServiceV1(_Config())
@@ -54,6 +93,70 @@ class SerializationTestCase(unittest.TestCase):
         obj2 = self.service.to_object(data)
         self.assertEqual(obj, obj2)
 
+    def test_deserialized_identified_address_equals_address(self):
+        class ServerAddress(IdentifiedDataSerializable):
+            # Writes what the server sends for the IdentifiedAddress
+            def write_data(self, object_data_output):
+                object_data_output.write_int(5701)
+                object_data_output.write_byte(0)
+                object_data_output.write_string("localhost")
+
+            def read_data(self, object_data_input):
+                pass
+
+            def get_factory_id(self):
+                return 0
+
+            def get_class_id(self):
+                return 1
+
+        data = self.service.to_data(ServerAddress())
+        identified_address = self.service.to_object(data)
+        address = Address("localhost", 5701)
+        self.assertEqual(hash(address), hash(identified_address))
+        self.assertEqual(address, identified_address)
+        self.assertEqual(identified_address, address)
+        self.assertEqual(1, {address: 1}.get(identified_address))
+
+        # Instances of the subclass are equal to each other as well
+        other_identified_address = self.service.to_object(data)
+        self.assertIsNot(identified_address, other_identified_address)
+        self.assertEqual(identified_address, other_identified_address)
+
+    def test_pickle_protocol_0_with_slotted_core_types(self):
+        info = DistributedObjectInfo("service", "name")
+        info2 = pickle.loads(pickle.dumps(info, 0))
+        self.assertEqual(info, info2)
+        self.assertEqual(hash(info), hash(info2))
+
+        json_value = HazelcastJsonValue('{"a": 1}')
+        json_value2 = pickle.loads(pickle.dumps(json_value, 0))
+        self.assertEqual(json_value, json_value2)
+        self.assertEqual(hash(json_value), hash(json_value2))
+
+        event = DistributedObjectEvent("name", "service", "CREATED", uuid.uuid4())
+        event2 = pickle.loads(pickle.dumps(event, 0))
+        for name in DistributedObjectEvent.__slots__:
+            self.assertEqual(getattr(event, name), getattr(event2, name))
+
+        view = SimpleEntryView("k", "v", 1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+        view2 = pickle.loads(pickle.dumps(view, 0))
+        for name in SimpleEntryView.__slots__:
+            self.assertEqual(getattr(view, name), getattr(view2, name))
+
+    def test_pickle_core_types_with_cached_hashes_across_processes(self):
+        script = (
+            _CREATE_CORE_VALUES
+            + "import pickle, sys\nsys.stdout.buffer.write(pickle.dumps(values))"
+        )
+        env = dict(os.environ, PYTHONHASHSEED="1")
+        pickled = subprocess.check_output([sys.executable, "-c", script], env=env)
+        namespace = {}
+        exec(_CREATE_CORE_VALUES, namespace)
+        for value, other in zip(namespace["values"], pickle.loads(pickled)):
+            self.assertEqual(value, other)
+            self.assertEqual(hash(value), hash(other))
+
     def test_python_pickle_serialization_with_super_type(self):
         obj = {"key-%d" % x: "value-%d" % x for x in range(0, 1000)}
         data = self.service.to_data(obj)
@@ -80,3 +183,18 @@ class SerializationTestCase(unittest.TestCase):
         obj = 0
         obj2 = self.service.to_object(obj)
         self.assertEqual(obj, obj2)
+
+    def test_consecutive_serializations_do_not_share_buffers(self):
+        data1 = self.service.to_data("a-longer-string")
+        data2 = self.service.to_data("b")
+
+        self.assertEqual("a-longer-string", self.service.to_object(data1))
+        self.assertEqual("b", self.service.to_object(data2))
+
+    def test_serialization_after_large_object(self):
+        obj = 4000 * [2.1]
+        self.service.to_data(obj)
+        data = self.service.to_data("TEST")
+
+        self.assertEqual(16, len(data.to_bytes()))
+        self.assertEqual("TEST", self.service.to_object(data))